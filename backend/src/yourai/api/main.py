@@ -0,0 +1,18 @@
+"""FastAPI application factory."""
+
+from fastapi import FastAPI
+from redis.asyncio import Redis
+
+from yourai.api.sse.routes import router as sse_router
+from yourai.core.config import get_settings
+
+
+def create_app(redis: Redis | None = None) -> FastAPI:
+    """Build the application, optionally with an injected Redis client."""
+    app = FastAPI(title="YourAI API")
+    app.state.redis = redis if redis is not None else Redis.from_url(get_settings().redis_url)
+    app.include_router(sse_router)
+    return app
+
+
+app = create_app()
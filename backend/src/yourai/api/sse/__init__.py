@@ -0,0 +1,15 @@
+"""Server-Sent Events: channels, publishing and streaming."""
+
+from yourai.api.sse.channels import SSEChannel
+from yourai.api.sse.events import ContentDeltaEvent, SSEEvent, StatusEvent
+from yourai.api.sse.publisher import EventPublisher
+from yourai.api.sse.stream import event_stream
+
+__all__ = [
+    "ContentDeltaEvent",
+    "EventPublisher",
+    "SSEChannel",
+    "SSEEvent",
+    "StatusEvent",
+    "event_stream",
+]
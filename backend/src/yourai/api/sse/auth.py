@@ -0,0 +1,81 @@
+"""Authentication for SSE endpoints.
+
+``EventSource`` cannot set request headers, so SSE endpoints accept a
+short-lived signed token in the ``token`` query parameter (a standard
+``Authorization: Bearer`` header is also honoured for non-browser
+clients). The token is HMAC-signed with the application secret and
+carries the user and tenant ids — the tenant is always taken from the
+token, never from request parameters.
+"""
+
+import base64
+import hashlib
+import hmac
+import time
+
+import orjson
+from fastapi import HTTPException, Request, status
+from pydantic import BaseModel
+
+from yourai.core.config import get_settings
+
+
+class AuthenticatedUser(BaseModel):
+    """Identity extracted from a verified SSE token."""
+
+    user_id: str
+    tenant_id: str
+
+
+def _sign(body: bytes) -> str:
+    secret = get_settings().secret_key.encode()
+    return hmac.new(secret, body, hashlib.sha256).hexdigest()
+
+
+def create_sse_token(
+    user_id: str, tenant_id: str, expires_in: int | None = None
+) -> str:
+    """Mint a short-lived token for connecting to an SSE endpoint."""
+    ttl = expires_in if expires_in is not None else get_settings().sse_token_ttl_seconds
+    payload = {"user_id": user_id, "tenant_id": tenant_id, "exp": time.time() + ttl}
+    body = base64.urlsafe_b64encode(orjson.dumps(payload))
+    return f"{body.decode()}.{_sign(body)}"
+
+
+def _unauthorised(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def decode_sse_token(token: str) -> AuthenticatedUser:
+    """Verify ``token`` and return the identity it carries.
+
+    Raises ``HTTPException(401)`` on any malformed, tampered or expired
+    token.
+    """
+    body, _, signature = token.partition(".")
+    if not signature or not hmac.compare_digest(_sign(body.encode()), signature):
+        raise _unauthorised("Invalid token")
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(body))
+    except (ValueError, orjson.JSONDecodeError):
+        raise _unauthorised("Invalid token") from None
+    if payload.get("exp", 0) < time.time():
+        raise _unauthorised("Token has expired")
+    return AuthenticatedUser(user_id=payload["user_id"], tenant_id=payload["tenant_id"])
+
+
+async def get_current_user_from_sse_token(request: Request) -> AuthenticatedUser:
+    """FastAPI dependency resolving the caller of an SSE endpoint."""
+    token = request.query_params.get("token")
+    if token is None:
+        authorisation = request.headers.get("authorization", "")
+        scheme, _, credential = authorisation.partition(" ")
+        if scheme.lower() == "bearer" and credential:
+            token = credential
+    if token is None:
+        raise _unauthorised("Not authenticated")
+    return decode_sse_token(token)
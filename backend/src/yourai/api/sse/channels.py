@@ -0,0 +1,41 @@
+"""Tenant-scoped SSE channel addressing.
+
+Channel keys always embed the tenant id so that pub/sub traffic and replay
+buffers are isolated per tenant — see ``.claude/rules/tenant-isolation.md``.
+"""
+
+from dataclasses import dataclass, field
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class SSEChannel:
+    """Addresses one logical event stream within a tenant.
+
+    Both Redis keys are materialised once at construction, as ``bytes``,
+    since redis-py encodes ``str`` keys on every call and the keys are hit
+    on every publish and subscribe.
+    """
+
+    tenant_id: str
+    scope: str
+    target_id: str
+    pubsub_key: bytes = field(init=False)
+    replay_key: bytes = field(init=False)
+
+    def __post_init__(self) -> None:
+        base = f"sse:{self.tenant_id}:{self.scope}:{self.target_id}"
+        object.__setattr__(self, "pubsub_key", base.encode())
+        object.__setattr__(self, "replay_key", f"{base}:replay".encode())
+
+    @classmethod
+    def for_conversation(cls, tenant_id: UUID | str, conversation_id: UUID | str) -> "SSEChannel":
+        return cls(str(tenant_id), "conv", str(conversation_id))
+
+    @classmethod
+    def for_policy_review(cls, tenant_id: UUID | str, review_id: UUID | str) -> "SSEChannel":
+        return cls(str(tenant_id), "review", str(review_id))
+
+    @classmethod
+    def for_user(cls, tenant_id: UUID | str, user_id: UUID | str) -> "SSEChannel":
+        return cls(str(tenant_id), "user", str(user_id))
@@ -0,0 +1,37 @@
+"""Event payloads carried over the SSE transport.
+
+Every event has a UUIDv7 ``event_id`` so that events are time-ordered and
+clients can resume a dropped stream with the standard ``Last-Event-ID``
+header.
+"""
+
+from typing import Literal
+
+import uuid_utils
+from pydantic import BaseModel, Field
+
+
+def _new_event_id() -> str:
+    return str(uuid_utils.uuid7())
+
+
+class SSEEvent(BaseModel):
+    """Base class for all events published to an :class:`SSEChannel`."""
+
+    event_id: str = Field(default_factory=_new_event_id)
+    event_type: str
+
+
+class ContentDeltaEvent(SSEEvent):
+    """Incremental text produced while an AI response is streaming."""
+
+    event_type: Literal["content_delta"] = "content_delta"
+    text: str
+
+
+class StatusEvent(SSEEvent):
+    """A change in the state of a long-running operation."""
+
+    event_type: Literal["status"] = "status"
+    status: str
+    detail: str | None = None
@@ -0,0 +1,50 @@
+"""Publishing events to SSE channels via Redis."""
+
+import time
+
+import ormsgpack
+import structlog
+from redis.asyncio import Redis
+
+from yourai.api.sse.channels import SSEChannel
+from yourai.api.sse.events import SSEEvent
+
+logger = structlog.get_logger(__name__)
+
+#: Maximum number of events retained per channel for reconnection replay.
+REPLAY_BUFFER_SIZE = 256
+
+#: How long a replay buffer survives after the last publish.
+REPLAY_TTL_SECONDS = 900
+
+
+class EventPublisher:
+    """Publishes events to a channel and maintains its replay buffer.
+
+    Events are fanned out over Redis pub/sub for live subscribers and
+    appended to a per-channel sorted set (scored by publish time) so that
+    clients reconnecting with ``Last-Event-ID`` can catch up.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self._redis = redis
+
+    async def publish(self, channel: SSEChannel, event: SSEEvent) -> str:
+        """Publish ``event`` to ``channel`` and return its event id."""
+        # Events travel through Redis as msgpack — smaller than JSON and
+        # faster to decode; they are rendered to JSON only at the SSE egress.
+        payload = ormsgpack.packb(event.model_dump(mode="json"))
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.zadd(channel.replay_key, {payload: time.time()})
+        pipe.zremrangebyrank(channel.replay_key, 0, -(REPLAY_BUFFER_SIZE + 1))
+        pipe.expire(channel.replay_key, REPLAY_TTL_SECONDS)
+        pipe.publish(channel.pubsub_key, payload)
+        await pipe.execute()
+        logger.debug(
+            "sse_event_published",
+            tenant_id=channel.tenant_id,
+            channel=channel.pubsub_key.decode(),
+            event_type=event.event_type,
+            event_id=event.event_id,
+        )
+        return event.event_id
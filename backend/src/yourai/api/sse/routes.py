@@ -0,0 +1,61 @@
+"""SSE streaming endpoints."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from yourai.api.sse.auth import AuthenticatedUser, get_current_user_from_sse_token
+from yourai.api.sse.channels import SSEChannel
+from yourai.api.sse.stream import event_stream
+
+router = APIRouter(prefix="/api/v1", tags=["events"])
+
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+_CurrentUser = Annotated[AuthenticatedUser, Depends(get_current_user_from_sse_token)]
+
+
+def _streaming_response(request: Request, channel: SSEChannel) -> StreamingResponse:
+    last_event_id = request.headers.get("last-event-id")
+    return StreamingResponse(
+        event_stream(request.app.state.redis, channel, last_event_id),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
+
+
+@router.get("/conversations/{conversation_id}/stream")
+async def conversation_stream(
+    conversation_id: UUID,
+    request: Request,
+    user: _CurrentUser,
+) -> StreamingResponse:
+    """Stream AI response events for one conversation."""
+    channel = SSEChannel.for_conversation(user.tenant_id, conversation_id)
+    return _streaming_response(request, channel)
+
+
+@router.get("/policy-reviews/{review_id}/stream")
+async def policy_review_stream(
+    review_id: UUID,
+    request: Request,
+    user: _CurrentUser,
+) -> StreamingResponse:
+    """Stream progress events for one policy review."""
+    channel = SSEChannel.for_policy_review(user.tenant_id, review_id)
+    return _streaming_response(request, channel)
+
+
+@router.get("/users/me/events")
+async def user_events(
+    request: Request,
+    user: _CurrentUser,
+) -> StreamingResponse:
+    """Stream notifications pushed to the authenticated user."""
+    channel = SSEChannel.for_user(user.tenant_id, user.user_id)
+    return _streaming_response(request, channel)
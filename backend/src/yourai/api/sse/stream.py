@@ -0,0 +1,72 @@
+"""Consuming an SSE channel as a stream of wire-format frames."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+import orjson
+import ormsgpack
+from redis.asyncio import Redis
+
+from yourai.api.sse.channels import SSEChannel
+
+#: Seconds of silence before a comment heartbeat is emitted to keep
+#: intermediaries from closing an idle connection.
+HEARTBEAT_INTERVAL = 15.0
+
+
+def format_sse_frame(event: dict[str, Any]) -> str:
+    """Render one event as a wire-format SSE frame."""
+    data = orjson.dumps(event).decode()
+    return f"id: {event['event_id']}\nevent: {event['event_type']}\ndata: {data}\n\n"
+
+
+async def event_stream(
+    redis: Redis,
+    channel: SSEChannel,
+    last_event_id: str | None = None,
+    *,
+    ready: asyncio.Event | None = None,
+    heartbeat_interval: float = HEARTBEAT_INTERVAL,
+) -> AsyncIterator[str]:
+    """Yield SSE frames for ``channel`` until the client disconnects.
+
+    The pub/sub subscription is established before any replay happens so no
+    event published in between can be lost; ``ready`` (if given) is set once
+    the subscription is live, which lets callers sequence a publish after
+    the subscriber is guaranteed to be attached.
+
+    When ``last_event_id`` is supplied, events published after it are
+    replayed from the channel's buffer before live delivery starts.
+    """
+    pubsub = redis.pubsub()
+    await pubsub.subscribe(channel.pubsub_key)
+    if ready is not None:
+        ready.set()
+    try:
+        seen: set[str] = set()
+        if last_event_id is not None:
+            entries = await redis.zrangebyscore(channel.replay_key, "-inf", "+inf")
+            emitting = False
+            for entry in entries:
+                # decode_responses is off, so replay entries are bytes.
+                event = ormsgpack.unpackb(cast(bytes, entry))
+                if emitting:
+                    seen.add(event["event_id"])
+                    yield format_sse_frame(event)
+                elif event["event_id"] == last_event_id:
+                    emitting = True
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=heartbeat_interval
+            )
+            if message is None:
+                yield ": heartbeat\n\n"
+                continue
+            event = ormsgpack.unpackb(message["data"])
+            if event["event_id"] in seen:
+                continue
+            yield format_sse_frame(event)
+    finally:
+        await pubsub.unsubscribe(channel.pubsub_key)
+        await pubsub.aclose()  # type: ignore[no-untyped-call]
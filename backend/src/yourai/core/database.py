@@ -0,0 +1,37 @@
+"""Async SQLAlchemy engine and session management."""
+
+import uuid
+
+import uuid_utils
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase
+
+from yourai.core.config import get_settings
+
+
+class Base(DeclarativeBase):
+    """Declarative base for all YourAI models."""
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a UUIDv7 as a stdlib UUID.
+
+    UUIDv7 primary keys are time-ordered, which keeps B-tree inserts
+    append-mostly on Postgres — see TECH_DECISIONS.md §3.
+    """
+    return uuid.UUID(bytes=uuid_utils.uuid7().bytes)
+
+
+def create_engine() -> AsyncEngine:
+    """Create the application database engine."""
+    return create_async_engine(get_settings().database_url, pool_size=5, max_overflow=15)
+
+
+def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create the session factory bound to ``engine``."""
+    return async_sessionmaker(engine, expire_on_commit=False)
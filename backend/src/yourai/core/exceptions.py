@@ -0,0 +1,21 @@
+"""Domain exceptions raised by services.
+
+API routes translate these into HTTP responses; services never raise
+``HTTPException`` directly.
+"""
+
+
+class YourAIError(Exception):
+    """Base class for all domain errors."""
+
+
+class ValidationError(YourAIError):
+    """The request was well-formed but violates a business rule."""
+
+
+class NotFoundError(YourAIError):
+    """The addressed resource does not exist within the caller's tenant."""
+
+
+class ConflictError(YourAIError):
+    """The operation conflicts with existing state (e.g. duplicate email)."""
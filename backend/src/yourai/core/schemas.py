@@ -0,0 +1,28 @@
+"""Request/response schemas for core user management."""
+
+import uuid
+
+from pydantic import BaseModel, EmailStr, Field
+
+from yourai.core.models import UserStatus
+
+
+class CreateUser(BaseModel):
+    email: EmailStr
+    full_name: str = Field(min_length=1, max_length=255)
+    role_id: uuid.UUID | None = None
+
+
+class UpdateUser(BaseModel):
+    full_name: str | None = None
+    status: UserStatus | None = None
+    role_id: uuid.UUID | None = None
+
+
+class UserFilters(BaseModel):
+    """Filtering and pagination options for listing users."""
+
+    status: UserStatus | None = None
+    search: str | None = None
+    page: int = Field(default=1, ge=1)
+    page_size: int = Field(default=50, ge=1, le=200)
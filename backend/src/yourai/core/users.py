@@ -0,0 +1,96 @@
+"""User management service."""
+
+import uuid
+
+import structlog
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from yourai.core.exceptions import ConflictError, NotFoundError, ValidationError
+from yourai.core.models import User, UserStatus
+from yourai.core.schemas import CreateUser, UpdateUser, UserFilters
+
+logger = structlog.get_logger(__name__)
+
+#: Allowed user status transitions. Anything not listed is rejected.
+VALID_STATUS_TRANSITIONS: dict[UserStatus, frozenset[UserStatus]] = {
+    UserStatus.INVITED: frozenset({UserStatus.ACTIVE}),
+    UserStatus.ACTIVE: frozenset({UserStatus.SUSPENDED, UserStatus.DEACTIVATED}),
+    UserStatus.SUSPENDED: frozenset({UserStatus.ACTIVE, UserStatus.DEACTIVATED}),
+    UserStatus.DEACTIVATED: frozenset(),
+}
+
+
+class UserService:
+    """CRUD and lifecycle operations for users within one tenant.
+
+    Every query filters by ``tenant_id`` in addition to the database's
+    RLS policies (belt and braces).
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def create_user(self, tenant_id: uuid.UUID, data: CreateUser) -> User:
+        existing = await self._session.scalar(
+            select(User.id).where(User.tenant_id == tenant_id, User.email == data.email)
+        )
+        if existing is not None:
+            raise ConflictError(f"A user with email {data.email} already exists")
+        user = User(
+            tenant_id=tenant_id,
+            email=data.email,
+            full_name=data.full_name,
+            role_id=data.role_id,
+        )
+        self._session.add(user)
+        await self._session.flush()
+        logger.info("user_created", tenant_id=str(tenant_id), user_id=str(user.id))
+        return user
+
+    async def get_user(self, tenant_id: uuid.UUID, user_id: uuid.UUID) -> User:
+        user = await self._session.scalar(
+            select(User).where(User.tenant_id == tenant_id, User.id == user_id)
+        )
+        if user is None:
+            raise NotFoundError(f"User {user_id} not found")
+        return user
+
+    async def update_user(
+        self, tenant_id: uuid.UUID, user_id: uuid.UUID, data: UpdateUser
+    ) -> User:
+        user = await self.get_user(tenant_id, user_id)
+        if data.status is not None and data.status != user.status:
+            if data.status not in VALID_STATUS_TRANSITIONS[user.status]:
+                raise ValidationError(
+                    f"Cannot change user status from {user.status.value} to {data.status.value}"
+                )
+            user.status = data.status
+        if data.full_name is not None:
+            user.full_name = data.full_name
+        if data.role_id is not None:
+            user.role_id = data.role_id
+        await self._session.flush()
+        logger.info("user_updated", tenant_id=str(tenant_id), user_id=str(user_id))
+        return user
+
+    async def list_users(self, tenant_id: uuid.UUID, filters: UserFilters) -> list[User]:
+        stmt = select(User).where(User.tenant_id == tenant_id, User.deleted_at.is_(None))
+        if filters.status is not None:
+            stmt = stmt.where(User.status == filters.status)
+        if filters.search:
+            pattern = f"%{filters.search}%"
+            stmt = stmt.where(User.full_name.ilike(pattern) | User.email.ilike(pattern))
+        stmt = (
+            stmt.order_by(User.id)
+            .offset((filters.page - 1) * filters.page_size)
+            .limit(filters.page_size)
+        )
+        return list((await self._session.execute(stmt)).scalars())
+
+    async def count_users(self, tenant_id: uuid.UUID) -> int:
+        return (
+            await self._session.scalar(
+                select(func.count()).select_from(User).where(User.tenant_id == tenant_id)
+            )
+        ) or 0
@@ -0,0 +1 @@
+"""Document processing, storage and search."""
@@ -0,0 +1,147 @@
+"""Structure-aware document chunking.
+
+Documents are split along the section boundaries found at extraction
+time; sections that exceed the token budget are split on sentence
+boundaries with a configurable overlap. Token counts are estimated at
+~4 characters per token, which is close enough for budget decisions.
+"""
+
+import re
+from dataclasses import dataclass
+
+from yourai.knowledge.extraction import Section
+
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """One retrievable unit of a document."""
+
+    content: str
+    index: int
+    token_count: int
+    section_heading: str | None = None
+    start_byte: int = 0
+    end_byte: int = 0
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def chunk_document(
+    text: str,
+    sections: list[Section] | None = None,
+    *,
+    target_tokens: int = 400,
+    max_tokens: int = 512,
+    overlap_tokens: int = 50,
+) -> list[Chunk]:
+    """Split ``text`` into chunks of roughly ``target_tokens`` tokens.
+
+    With ``sections``, each section is chunked separately and its heading
+    is carried on every chunk it produces; otherwise the whole document
+    is split on sentence boundaries (fixed-size fallback).
+    """
+    if not text.strip():
+        return []
+    pieces: list[tuple[str, int, str | None]] = []
+    if sections:
+        for section in sections:
+            pieces.append((text[section.start : section.end], section.start, section.heading))
+    else:
+        pieces.append((text, 0, None))
+
+    chunks: list[Chunk] = []
+    for body, base, heading in pieces:
+        _chunk_piece(
+            body,
+            base,
+            heading,
+            chunks,
+            text,
+            target_tokens=target_tokens,
+            max_tokens=max_tokens,
+            overlap_tokens=overlap_tokens,
+        )
+    return chunks
+
+
+def _sentences(body: str) -> list[tuple[str, int]]:
+    """Split ``body`` into (sentence, char offset) pairs."""
+    out: list[tuple[str, int]] = []
+    position = 0
+    for match in _SENTENCE_BREAK.finditer(body):
+        sentence = body[position : match.start()]
+        if sentence.strip():
+            out.append((sentence, position))
+        position = match.end()
+    tail = body[position:]
+    if tail.strip():
+        out.append((tail, position))
+    return out
+
+
+def _chunk_piece(
+    body: str,
+    base: int,
+    heading: str | None,
+    chunks: list[Chunk],
+    full_text: str,
+    *,
+    target_tokens: int,
+    max_tokens: int,
+    overlap_tokens: int,
+) -> None:
+    max_chars = max_tokens * 4
+    sentences: list[tuple[str, int]] = []
+    for sentence, offset in _sentences(body):
+        # Hard-split pathological sentences that alone exceed the budget.
+        while len(sentence) > max_chars:
+            sentences.append((sentence[:max_chars], offset))
+            sentence = sentence[max_chars:]
+            offset += max_chars
+        sentences.append((sentence, offset))
+
+    current: list[tuple[str, int]] = []
+    current_tokens = 0
+    for sentence, offset in sentences:
+        tokens = estimate_tokens(sentence)
+        if current and current_tokens + tokens > target_tokens:
+            _emit(chunks, current, base, heading, full_text)
+            overlap: list[tuple[str, int]] = []
+            kept = 0
+            for prev in reversed(current):
+                kept += estimate_tokens(prev[0])
+                overlap.insert(0, prev)
+                if kept >= overlap_tokens:
+                    break
+            current = overlap
+            current_tokens = kept
+        current.append((sentence, offset))
+        current_tokens += tokens
+    if current:
+        _emit(chunks, current, base, heading, full_text)
+
+
+def _emit(
+    chunks: list[Chunk],
+    sentences: list[tuple[str, int]],
+    base: int,
+    heading: str | None,
+    full_text: str,
+) -> None:
+    start = base + sentences[0][1]
+    end = base + sentences[-1][1] + len(sentences[-1][0])
+    content = full_text[start:end]
+    chunks.append(
+        Chunk(
+            content=content,
+            index=len(chunks),
+            token_count=estimate_tokens(content),
+            section_heading=heading,
+            start_byte=len(full_text[:start].encode("utf-8")),
+            end_byte=len(full_text[:end].encode("utf-8")),
+        )
+    )
@@ -0,0 +1,127 @@
+"""Document upload, versioning and lifecycle service."""
+
+import uuid
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from yourai.core.exceptions import NotFoundError, ValidationError
+from yourai.knowledge.models import Document, ProcessingState
+from yourai.knowledge.storage import LocalFileStorage
+from yourai.knowledge.tasks import enqueue_document_processing
+from yourai.knowledge.validation import validate_upload
+
+logger = structlog.get_logger(__name__)
+
+#: Retries allowed before a failed document is dead-lettered.
+MAX_RETRIES = 3
+
+
+class DocumentService:
+    """Manages documents within one tenant's knowledge bases."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def upload_document(
+        self,
+        tenant_id: uuid.UUID,
+        knowledge_base_id: uuid.UUID,
+        filename: str,
+        data: bytes,
+    ) -> Document:
+        """Validate, store and register an upload, then queue processing.
+
+        Uploading a file whose name already exists in the knowledge base
+        creates a new version linked to the previous one.
+        """
+        mime_type = validate_upload(data, filename)
+        storage = LocalFileStorage(tenant_id)
+        content_hash = await storage.file_hash(data)
+        previous = await self._session.scalar(
+            select(Document)
+            .where(
+                Document.tenant_id == tenant_id,
+                Document.knowledge_base_id == knowledge_base_id,
+                Document.name == filename,
+                Document.deleted_at.is_(None),
+            )
+            .order_by(Document.version.desc())
+            .limit(1)
+        )
+        uri = await storage.save(filename, data)
+        document = Document(
+            tenant_id=tenant_id,
+            knowledge_base_id=knowledge_base_id,
+            name=filename,
+            mime_type=mime_type,
+            document_uri=uri,
+            content_hash=content_hash,
+            version=previous.version + 1 if previous else 1,
+            previous_version_id=previous.id if previous else None,
+        )
+        self._session.add(document)
+        await self._session.flush()
+        await enqueue_document_processing(document.id, tenant_id)
+        logger.info(
+            "document_uploaded",
+            tenant_id=str(tenant_id),
+            document_id=str(document.id),
+            version=document.version,
+        )
+        return document
+
+    async def get_document(self, tenant_id: uuid.UUID, document_id: uuid.UUID) -> Document:
+        document = await self._session.scalar(
+            select(Document).where(
+                Document.tenant_id == tenant_id,
+                Document.id == document_id,
+                Document.deleted_at.is_(None),
+            )
+        )
+        if document is None:
+            raise NotFoundError(f"Document {document_id} not found")
+        return document
+
+    async def get_versions(
+        self, tenant_id: uuid.UUID, knowledge_base_id: uuid.UUID, name: str
+    ) -> list[Document]:
+        """Return all versions of a named document, oldest first."""
+        result = await self._session.execute(
+            select(Document)
+            .where(
+                Document.tenant_id == tenant_id,
+                Document.knowledge_base_id == knowledge_base_id,
+                Document.name == name,
+            )
+            .order_by(Document.version)
+        )
+        return list(result.scalars())
+
+    async def delete_document(self, tenant_id: uuid.UUID, document_id: uuid.UUID) -> None:
+        document = await self.get_document(tenant_id, document_id)
+        storage = LocalFileStorage(tenant_id)
+        await storage.delete(document.document_uri)
+        await self._session.delete(document)
+        await self._session.flush()
+        logger.info(
+            "document_deleted", tenant_id=str(tenant_id), document_id=str(document_id)
+        )
+
+    async def retry_failed(self, tenant_id: uuid.UUID, document_id: uuid.UUID) -> Document:
+        """Re-queue a failed document, dead-lettering it after MAX_RETRIES."""
+        document = await self.get_document(tenant_id, document_id)
+        if document.processing_state != ProcessingState.FAILED:
+            raise ValidationError("Only failed documents can be retried")
+        if document.dead_letter:
+            raise ValidationError("Document is dead-lettered and cannot be retried")
+        document.retry_count += 1
+        if document.retry_count > MAX_RETRIES:
+            document.dead_letter = True
+            await self._session.flush()
+            raise ValidationError("Document has exhausted its retries")
+        document.processing_state = ProcessingState.PENDING
+        await self._session.flush()
+        await enqueue_document_processing(document.id, tenant_id)
+        return document
@@ -0,0 +1,110 @@
+"""Text extraction from uploaded documents.
+
+Produces plain text plus a list of detected sections (heading + character
+range) that the chunker uses for structure-aware splitting. PyMuPDF and
+python-docx are imported lazily so environments without them can still
+use the rest of the knowledge module.
+"""
+
+import statistics
+from dataclasses import dataclass
+
+from yourai.core.exceptions import ValidationError
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+@dataclass(frozen=True)
+class Section:
+    """A heading and the character range of the text it introduces."""
+
+    heading: str
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class ExtractedText:
+    text: str
+    sections: list[Section]
+
+
+def extract_text(data: bytes, mime_type: str) -> ExtractedText:
+    """Extract text and section structure from ``data``."""
+    if mime_type == "application/pdf":
+        return _extract_pdf(data)
+    if mime_type == DOCX_MIME:
+        return _extract_docx(data)
+    if mime_type in ("text/plain", "text/markdown"):
+        return _extract_markdown(data.decode("utf-8", errors="replace"))
+    raise ValidationError(f"Cannot extract text from {mime_type}")
+
+
+def _build(lines: list[tuple[str, bool]]) -> ExtractedText:
+    """Assemble text and sections from (line, is_heading) pairs."""
+    parts: list[str] = []
+    headings: list[tuple[str, int]] = []
+    offset = 0
+    for line, is_heading in lines:
+        if is_heading:
+            headings.append((line, offset))
+        parts.append(line)
+        offset += len(line) + 1
+    text = "\n".join(parts)
+    sections = [
+        Section(heading, start, headings[i + 1][1] if i + 1 < len(headings) else len(text))
+        for i, (heading, start) in enumerate(headings)
+    ]
+    return ExtractedText(text, sections)
+
+
+def _extract_pdf(data: bytes) -> ExtractedText:
+    import fitz
+
+    lines: list[tuple[str, bool]] = []
+    sizes: list[float] = []
+    raw: list[tuple[str, float]] = []
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        for page in doc:
+            for block in page.get_text("dict")["blocks"]:
+                for line in block.get("lines", []):
+                    spans = line.get("spans", [])
+                    text = "".join(span["text"] for span in spans).strip()
+                    if not text:
+                        continue
+                    size = max(span["size"] for span in spans)
+                    raw.append((text, size))
+                    sizes.append(size)
+    if not raw:
+        return ExtractedText("", [])
+    body_size = statistics.median(sizes)
+    for text, size in raw:
+        # A line noticeably larger than the body text is treated as a heading.
+        lines.append((text, size >= body_size * 1.25 and len(text) < 120))
+    return _build(lines)
+
+
+def _extract_docx(data: bytes) -> ExtractedText:
+    import io
+
+    from docx import Document as DocxDocument
+
+    document = DocxDocument(io.BytesIO(data))
+    lines = [
+        # Paragraphs can lack a resolved style, in which case they are body text.
+        (
+            paragraph.text.strip(),
+            paragraph.style is not None and paragraph.style.name.startswith("Heading"),
+        )
+        for paragraph in document.paragraphs
+        if paragraph.text.strip()
+    ]
+    return _build(lines)
+
+
+def _extract_markdown(text: str) -> ExtractedText:
+    lines = [
+        (line.lstrip("# ").strip() if line.startswith("#") else line, line.startswith("#"))
+        for line in text.splitlines()
+    ]
+    return _build(lines)
@@ -0,0 +1,137 @@
+"""Knowledge-base management service."""
+
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+from sqlalchemy import Select, and_, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+
+from yourai.core.exceptions import NotFoundError
+from yourai.knowledge.models import Document, KnowledgeBase, ProcessingState
+from yourai.knowledge.schemas import CreateKnowledgeBase, KnowledgeBaseRead
+from yourai.knowledge.vector_store import VectorStore
+
+logger = structlog.get_logger(__name__)
+
+
+class KnowledgeBaseService:
+    """Manages one tenant's knowledge bases and their vector collections."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def create_knowledge_base(
+        self, tenant_id: uuid.UUID, data: CreateKnowledgeBase
+    ) -> KnowledgeBase:
+        knowledge_base = KnowledgeBase(
+            tenant_id=tenant_id,
+            name=data.name,
+            description=data.description,
+            category=data.category,
+        )
+        self._session.add(knowledge_base)
+        await self._session.flush()
+        await VectorStore(tenant_id).ensure_collection()
+        logger.info(
+            "knowledge_base_created",
+            tenant_id=str(tenant_id),
+            knowledge_base_id=str(knowledge_base.id),
+        )
+        return knowledge_base
+
+    async def get_knowledge_base(
+        self, tenant_id: uuid.UUID, knowledge_base_id: uuid.UUID
+    ) -> KnowledgeBaseRead:
+        row = (
+            await self._session.execute(
+                self._with_counts(tenant_id).where(KnowledgeBase.id == knowledge_base_id)
+            )
+        ).one_or_none()
+        if row is None:
+            raise NotFoundError(f"Knowledge base {knowledge_base_id} not found")
+        knowledge_base, document_count, ready_count = row
+        return self._to_schema(knowledge_base, document_count, ready_count)
+
+    async def list_knowledge_bases(self, tenant_id: uuid.UUID) -> list[KnowledgeBaseRead]:
+        result = await self._session.execute(
+            self._with_counts(tenant_id).order_by(KnowledgeBase.name)
+        )
+        return [
+            self._to_schema(knowledge_base, document_count, ready_count)
+            for knowledge_base, document_count, ready_count in result
+        ]
+
+    async def delete_knowledge_base(
+        self, tenant_id: uuid.UUID, knowledge_base_id: uuid.UUID
+    ) -> None:
+        knowledge_base = await self._get_row(tenant_id, knowledge_base_id)
+        knowledge_base.deleted_at = datetime.now(UTC)
+        await self._session.flush()
+        await VectorStore(tenant_id).delete_points(knowledge_base_id)
+        logger.info(
+            "knowledge_base_deleted",
+            tenant_id=str(tenant_id),
+            knowledge_base_id=str(knowledge_base_id),
+        )
+
+    def _with_counts(self, tenant_id: uuid.UUID) -> Select[Any]:
+        """Statement selecting knowledge bases with both document counts.
+
+        The counts ride along as aggregates on an outer join, so a lookup
+        costs one round trip instead of one per count.
+        """
+        return (
+            select(
+                KnowledgeBase,
+                func.count(Document.id),
+                func.count(case((Document.processing_state == ProcessingState.READY, 1))),
+            )
+            .outerjoin(
+                Document,
+                and_(
+                    Document.knowledge_base_id == KnowledgeBase.id,
+                    # Belt-and-braces with RLS: every query leg filters
+                    # by tenant, including join conditions.
+                    Document.tenant_id == tenant_id,
+                    Document.deleted_at.is_(None),
+                ),
+            )
+            .where(
+                KnowledgeBase.tenant_id == tenant_id,
+                KnowledgeBase.deleted_at.is_(None),
+            )
+            .group_by(KnowledgeBase.id)
+            # Everything the schema needs is in this statement; any lazy
+            # relationship access afterwards is a bug, so make it raise.
+            .options(raiseload("*"))
+        )
+
+    async def _get_row(
+        self, tenant_id: uuid.UUID, knowledge_base_id: uuid.UUID
+    ) -> KnowledgeBase:
+        knowledge_base = await self._session.scalar(
+            select(KnowledgeBase).where(
+                KnowledgeBase.tenant_id == tenant_id,
+                KnowledgeBase.id == knowledge_base_id,
+                KnowledgeBase.deleted_at.is_(None),
+            )
+        )
+        if knowledge_base is None:
+            raise NotFoundError(f"Knowledge base {knowledge_base_id} not found")
+        return knowledge_base
+
+    @staticmethod
+    def _to_schema(
+        knowledge_base: KnowledgeBase, document_count: int, ready_count: int
+    ) -> KnowledgeBaseRead:
+        return KnowledgeBaseRead(
+            id=knowledge_base.id,
+            name=knowledge_base.name,
+            description=knowledge_base.description,
+            category=knowledge_base.category,
+            document_count=document_count,
+            ready_document_count=ready_count,
+        )
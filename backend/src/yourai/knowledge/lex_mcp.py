@@ -0,0 +1,70 @@
+"""MCP client for the Parliament/Lex MCP server (optional integration)."""
+
+from types import TracebackType
+from typing import Any, Self
+
+import structlog
+
+try:
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+except ImportError:  # pragma: no cover - optional dependency
+    ClientSession = None
+    streamablehttp_client = None
+
+logger = structlog.get_logger(__name__)
+
+SEARCH_TOOL = "search_legislation"
+
+
+class LexMcpClient:
+    """Streamable-HTTP MCP session against the Lex MCP endpoint."""
+
+    def __init__(self, url: str) -> None:
+        self._url = url
+        # Any rather than mcp types: the dependency is optional, so its
+        # names must not appear in annotations evaluated at runtime.
+        self._transport_cm: Any = None
+        self._session_cm: Any = None
+        self._session: Any = None
+
+    @property
+    def connected(self) -> bool:
+        return self._session is not None
+
+    async def connect(self) -> None:
+        if streamablehttp_client is None:
+            raise RuntimeError("The mcp package is not installed")
+        self._transport_cm = streamablehttp_client(self._url)
+        read, write, _ = await self._transport_cm.__aenter__()
+        self._session_cm = ClientSession(read, write)
+        self._session = await self._session_cm.__aenter__()
+        await self._session.initialize()
+        logger.info("lex_mcp_connected", url=self._url)
+
+    async def disconnect(self) -> None:
+        if self._session_cm is not None:
+            await self._session_cm.__aexit__(None, None, None)
+        if self._transport_cm is not None:
+            await self._transport_cm.__aexit__(None, None, None)
+        self._session = None
+        self._session_cm = None
+        self._transport_cm = None
+
+    async def __aenter__(self) -> Self:
+        await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        await self.disconnect()
+        return False
+
+    async def search(self, query: str, *, limit: int = 10) -> Any:
+        if self._session is None:
+            raise RuntimeError("Client is not connected")
+        return await self._session.call_tool(SEARCH_TOOL, {"query": query, "limit": limit})
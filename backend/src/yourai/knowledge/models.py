@@ -0,0 +1,63 @@
+"""Knowledge-base and document models.
+
+Tenant-scoped tables — every row carries ``tenant_id`` and is covered by
+an RLS policy in its migration.
+"""
+
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from yourai.core.database import Base, uuid7
+from yourai.core.models import TimestampMixin
+
+
+class ProcessingState(str, enum.Enum):
+    """Pipeline states of an uploaded document."""
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class KnowledgeBase(TimestampMixin, Base):
+    __tablename__ = "knowledge_bases"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"), index=True)
+    name: Mapped[str] = mapped_column(String(255))
+    description: Mapped[str | None] = mapped_column(String(1023), default=None)
+    category: Mapped[str] = mapped_column(String(63), default="general")
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+
+    documents: Mapped[list["Document"]] = relationship(back_populates="knowledge_base")
+
+
+class Document(TimestampMixin, Base):
+    __tablename__ = "documents"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"), index=True)
+    knowledge_base_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("knowledge_bases.id"), index=True
+    )
+    name: Mapped[str] = mapped_column(String(255))
+    mime_type: Mapped[str | None] = mapped_column(String(127), default=None)
+    document_uri: Mapped[str] = mapped_column(String(1023))
+    content_hash: Mapped[str | None] = mapped_column(String(64), default=None)
+    version: Mapped[int] = mapped_column(Integer, default=1)
+    previous_version_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("documents.id"), default=None
+    )
+    processing_state: Mapped[ProcessingState] = mapped_column(
+        Enum(ProcessingState, native_enum=False, length=31), default=ProcessingState.PENDING
+    )
+    retry_count: Mapped[int] = mapped_column(Integer, default=0)
+    dead_letter: Mapped[bool] = mapped_column(Boolean, default=False)
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+
+    knowledge_base: Mapped[KnowledgeBase] = relationship(back_populates="documents")
@@ -0,0 +1,20 @@
+"""Request/response schemas for knowledge-base endpoints."""
+
+import uuid
+
+from pydantic import BaseModel, Field
+
+
+class CreateKnowledgeBase(BaseModel):
+    name: str = Field(min_length=1, max_length=255)
+    description: str | None = Field(default=None, max_length=1023)
+    category: str = Field(default="general", max_length=63)
+
+
+class KnowledgeBaseRead(BaseModel):
+    id: uuid.UUID
+    name: str
+    description: str | None
+    category: str
+    document_count: int
+    ready_document_count: int
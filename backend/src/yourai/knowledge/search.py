@@ -0,0 +1,82 @@
+"""Hybrid-search result fusion.
+
+Vector and BM25 keyword hits are merged with Reciprocal Rank Fusion
+(RRF): each chunk contributes ``1 / (k + rank)`` for every result list
+it appears in, so chunks found by both retrievers rise above chunks
+found by only one. Raw retriever scores are deliberately ignored —
+they are not comparable across retrievers.
+"""
+
+import uuid
+from collections.abc import Sequence
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+#: Standard RRF damping constant; higher values flatten rank differences.
+DEFAULT_RRF_K = 60
+
+
+class _RankedResult(BaseModel):
+    """Common shape of one ranked hit, whichever retriever produced it."""
+
+    chunk_id: uuid.UUID
+    document_id: uuid.UUID
+    score: float
+    content: str
+
+
+class VectorResult(_RankedResult):
+    pass
+
+
+class KeywordResult(_RankedResult):
+    pass
+
+
+class FusedResult(_RankedResult):
+    pass
+
+
+class SearchService:
+    """Hybrid retrieval over a tenant's knowledge bases.
+
+    Fuses vector and keyword hits with :func:`rrf_fusion`. The retrieval
+    backends (Qdrant query + BM25) land with the agents work package;
+    until then both legs return nothing.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def hybrid_search(
+        self, tenant_id: uuid.UUID, query: str, *, limit: int = 10
+    ) -> list["FusedResult"]:
+        vector_results: list[VectorResult] = []
+        keyword_results: list[KeywordResult] = []
+        return rrf_fusion(vector_results, keyword_results)[:limit]
+
+
+def rrf_fusion(
+    vector_results: Sequence[VectorResult],
+    keyword_results: Sequence[KeywordResult],
+    *,
+    k: int = DEFAULT_RRF_K,
+) -> list[FusedResult]:
+    """Fuse ranked result lists, best combined score first."""
+    fused: dict[uuid.UUID, FusedResult] = {}
+    result_lists: tuple[Sequence[_RankedResult], ...] = (vector_results, keyword_results)
+    for results in result_lists:
+        for rank, result in enumerate(results, start=1):
+            contribution = 1.0 / (k + rank)
+            existing = fused.get(result.chunk_id)
+            if existing is None:
+                fused[result.chunk_id] = FusedResult(
+                    chunk_id=result.chunk_id,
+                    document_id=result.document_id,
+                    score=contribution,
+                    content=result.content,
+                )
+            else:
+                existing.score += contribution
+    return sorted(fused.values(), key=lambda result: result.score, reverse=True)
@@ -0,0 +1,31 @@
+"""Tenant-partitioned file storage for uploaded documents."""
+
+import hashlib
+import uuid
+from pathlib import Path
+
+import anyio
+
+
+class LocalFileStorage:
+    """Stores uploaded files on the local filesystem, one tree per tenant.
+
+    A stand-in for object storage in production deployments; the
+    interface is deliberately narrow so an S3-backed implementation can
+    be swapped in.
+    """
+
+    def __init__(self, tenant_id: uuid.UUID | str, root: Path | str = "/uploads") -> None:
+        self._base = Path(root) / str(tenant_id)
+
+    async def file_hash(self, data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    async def save(self, filename: str, data: bytes) -> str:
+        path = self._base / filename
+        await anyio.to_thread.run_sync(path.parent.mkdir, 0o755, True, True)
+        await anyio.Path(path).write_bytes(data)
+        return str(path)
+
+    async def delete(self, uri: str) -> None:
+        await anyio.Path(uri).unlink(missing_ok=True)
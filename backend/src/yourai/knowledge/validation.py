@@ -0,0 +1,172 @@
+"""Upload validation: MIME detection, size limits and safety checks."""
+
+import io
+import os
+from typing import BinaryIO, cast
+
+from yourai.core.config import get_settings
+from yourai.core.exceptions import ValidationError
+
+#: MIME types accepted for ingestion.
+ALLOWED_MIME_TYPES: frozenset[str] = frozenset(
+    {
+        "application/pdf",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "text/plain",
+        "text/markdown",
+        "text/html",
+    }
+)
+
+#: Maximum accepted upload size (50 MiB).
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+
+#: Bytes of the upload inspected for content sniffing. Magic-byte
+#: signatures live in the first handful of bytes; 256 is enough to also
+#: catch an HTML doctype behind leading whitespace.
+SNIFF_BYTES = 256
+
+#: Declarative magic-byte table; compiled into a prefix trie at import.
+_MAGIC_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"%PDF-", "application/pdf"),
+    (b"PK\x03\x04", "application/zip"),
+    (b"\xd0\xcf\x11\xe0", "application/msword"),
+    (b"{\\rtf", "application/rtf"),
+)
+
+#: Key under which a trie node stores its matched MIME type; all other
+#: keys are byte values.
+_LEAF = "mime"
+
+#: Trie nodes map byte values to child nodes; the ``_LEAF`` key holds
+#: the matched MIME type, so values are either child nodes or strings.
+_TrieNode = dict[int | str, "_TrieNode | str"]
+
+
+def _build_magic_trie(signatures: tuple[tuple[bytes, str], ...]) -> _TrieNode:
+    root: _TrieNode = {}
+    for prefix, mime in signatures:
+        node = root
+        for byte in prefix:
+            child = node.setdefault(byte, {})
+            assert isinstance(child, dict)  # byte keys only ever hold nodes
+            node = child
+        node[_LEAF] = mime
+    return root
+
+
+_MAGIC_TRIE = _build_magic_trie(_MAGIC_SIGNATURES)
+
+#: Extension fallback for text formats without a magic-byte signature.
+_EXT_MIME: dict[str, str] = {
+    ".md": "text/markdown",
+    ".markdown": "text/markdown",
+    ".txt": "text/plain",
+    ".html": "text/html",
+    ".htm": "text/html",
+}
+
+
+def _match_magic(header: bytes) -> str | None:
+    """Walk the signature trie over ``header``; None when nothing matches."""
+    node: _TrieNode = _MAGIC_TRIE
+    for byte in header:
+        child = node.get(byte)
+        if not isinstance(child, dict):
+            return None
+        node = child
+        mime = node.get(_LEAF)
+        if isinstance(mime, str):
+            return mime
+    return None
+
+
+def _deep_detect(header: bytes) -> str | None:
+    """Identify ``header`` with libmagic, if installed.
+
+    Import is deferred so the signature database only loads on the rare
+    stream that both the trie and the extension map miss.
+    """
+    try:  # pragma: no cover - optional dependency
+        import magic
+    except ImportError:  # pragma: no cover
+        return None
+    return cast(str, magic.from_buffer(header, mime=True))  # pragma: no cover
+
+
+def detect_mime_type(header: bytes | memoryview, filename: str) -> str:
+    """Determine the MIME type of an upload from its leading bytes.
+
+    Only the first :data:`SNIFF_BYTES` are examined, so callers can pass
+    a ``memoryview`` prefix instead of copying the whole payload. Magic
+    bytes take precedence; the file extension is only consulted for
+    formats that have no signature (and to tell docx from plain zip).
+    """
+    header = bytes(header[:SNIFF_BYTES])
+    ext = os.path.splitext(filename)[1].lower()
+    mime = _match_magic(header)
+    if mime == "application/zip" and ext == ".docx":
+        return "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    if mime is not None:
+        return mime
+    lowered = header.lower()
+    if b"<html" in lowered or b"<!doctype html" in lowered:
+        return "text/html"
+    by_extension = _EXT_MIME.get(ext)
+    if by_extension is not None:
+        return by_extension
+    if get_settings().enable_deep_mime_detection:
+        deep = _deep_detect(header)
+        if deep is not None:
+            return deep
+    try:
+        header.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        # A multi-byte character truncated at the sniff boundary is
+        # still text; any other decode error means binary content.
+        if len(header) < SNIFF_BYTES or exc.start < SNIFF_BYTES - 3:
+            return "application/octet-stream"
+    return "text/plain"
+
+
+#: Window scanned at each end of a PDF for the /Encrypt reference. The
+#: encryption dictionary is referenced from the trailer, so scanning the
+#: whole payload is unnecessary.
+_ENCRYPT_WINDOW = 4096
+
+
+def _pdf_is_encrypted(reader: BinaryIO, size: int) -> bool:
+    reader.seek(0)
+    head = reader.read(_ENCRYPT_WINDOW)
+    reader.seek(max(0, size - _ENCRYPT_WINDOW))
+    tail = reader.read(_ENCRYPT_WINDOW)
+    return b"/Encrypt" in head or b"/Encrypt" in tail
+
+
+def validate_upload_stream(reader: BinaryIO, filename: str) -> str:
+    """Validate an upload from a seekable binary reader.
+
+    Reads only the sniff prefix and the encrypted-PDF windows, so peak
+    memory stays at a few KiB regardless of file size. The reader is
+    left positioned at the start. Raises :class:`ValidationError` for
+    unsupported types, oversized files and encrypted PDFs.
+    """
+    # Cheapest gate first: reject oversized uploads without reading them.
+    size = reader.seek(0, os.SEEK_END)
+    if size > MAX_UPLOAD_BYTES:
+        raise ValidationError(
+            f"File exceeds the maximum upload size of {MAX_UPLOAD_BYTES // (1024 * 1024)} MiB"
+        )
+    reader.seek(0)
+    mime_type = detect_mime_type(reader.read(SNIFF_BYTES), filename)
+    if mime_type not in ALLOWED_MIME_TYPES:
+        raise ValidationError(f"Unsupported file type: {mime_type}")
+    if mime_type == "application/pdf" and _pdf_is_encrypted(reader, size):
+        raise ValidationError("Encrypted PDFs are not supported")
+    reader.seek(0)
+    return mime_type
+
+
+def validate_upload(data: bytes, filename: str) -> str:
+    """Validate an in-memory upload and return its detected MIME type."""
+    return validate_upload_stream(io.BytesIO(data), filename)
@@ -0,0 +1,76 @@
+"""Tenant-scoped Qdrant access.
+
+Every tenant gets its own collection, ``tenant_{tenant_id}_documents`` —
+never a shared collection with a metadata filter.
+"""
+
+import uuid
+from typing import TYPE_CHECKING
+
+import structlog
+
+if TYPE_CHECKING:
+    from qdrant_client import AsyncQdrantClient
+
+logger = structlog.get_logger(__name__)
+
+#: Dimensionality of the embedding model currently in use.
+VECTOR_SIZE = 1024
+
+
+class VectorStore:
+    """Vector operations against one tenant's Qdrant collection."""
+
+    def __init__(self, tenant_id: uuid.UUID, url: str = "http://localhost:6333") -> None:
+        self.tenant_id = tenant_id
+        self.collection_name = f"tenant_{tenant_id}_documents"
+        self._url = url
+
+    def _client(self) -> "AsyncQdrantClient":  # pragma: no cover - requires a running Qdrant
+        # Imported lazily so the package works without qdrant-client
+        # installed (tests inject a mock store).
+        from qdrant_client import AsyncQdrantClient
+
+        return AsyncQdrantClient(url=self._url)
+
+    async def ensure_collection(self) -> None:  # pragma: no cover
+        """Create the tenant's collection if it does not already exist."""
+        from qdrant_client import models
+
+        client = self._client()
+        if not await client.collection_exists(self.collection_name):
+            await client.create_collection(
+                self.collection_name,
+                vectors_config=models.VectorParams(
+                    size=VECTOR_SIZE, distance=models.Distance.COSINE
+                ),
+            )
+            logger.info(
+                "vector_collection_created",
+                tenant_id=str(self.tenant_id),
+                collection=self.collection_name,
+            )
+
+    async def delete_points(self, knowledge_base_id: uuid.UUID) -> None:  # pragma: no cover
+        """Drop all vectors belonging to one knowledge base."""
+        from qdrant_client import models
+
+        client = self._client()
+        await client.delete(
+            self.collection_name,
+            points_selector=models.FilterSelector(
+                filter=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key="knowledge_base_id",
+                            match=models.MatchValue(value=str(knowledge_base_id)),
+                        )
+                    ]
+                )
+            ),
+        )
+        logger.info(
+            "vector_points_deleted",
+            tenant_id=str(self.tenant_id),
+            knowledge_base_id=str(knowledge_base_id),
+        )
@@ -0,0 +1 @@
+"""Regulatory monitoring — Lex integration and change detection."""
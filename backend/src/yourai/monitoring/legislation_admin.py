@@ -0,0 +1,100 @@
+"""Administrative service over the Lex legislation index."""
+
+import asyncio
+import uuid
+from typing import Any
+
+import httpx
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from yourai.monitoring.lex_client import Legislation, LexRestClient
+from yourai.monitoring.lex_health import LexHealthManager
+from yourai.monitoring.lex_tasks import build_ingestion_command, enqueue_ingestion
+from yourai.monitoring.models import IngestionJob
+
+logger = structlog.get_logger(__name__)
+
+#: Container the self-hosted Lex ingestion process runs in.
+INGEST_CONTAINER = "lex-ingest"
+
+
+class LegislationAdminService:
+    """Overview, search and ingestion management for the legislation index."""
+
+    def __init__(
+        self, health: LexHealthManager, session: AsyncSession | None = None
+    ) -> None:
+        self._health = health
+        self._session = session
+
+    async def get_overview(self) -> dict[str, Any]:
+        """Health plus headline index counts for the admin dashboard."""
+        healthy = await self._health.check_health()
+        try:
+            total = await self._health.active_client.count_by_filter()
+        except httpx.HTTPError:
+            total = 0
+        return {
+            "healthy": healthy,
+            "using_fallback": self._health.using_fallback,
+            "total_legislation": total,
+        }
+
+    async def search(
+        self,
+        query: str,
+        *,
+        type: str | None = None,
+        year: int | None = None,
+        limit: int = 20,
+    ) -> list[Legislation]:
+        return await self._health.active_client.search(
+            query, type=type, year=year, limit=limit
+        )
+
+    async def get_detail(self, legislation_id: str) -> dict[str, Any]:
+        """The full picture for one piece of legislation.
+
+        The three Lex calls are independent, so they run concurrently —
+        latency is the slowest call rather than the sum of all three.
+        """
+        client = LexRestClient(self._health.active_base_url)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                legislation = tg.create_task(client.lookup_legislation(legislation_id))
+                sections = tg.create_task(client.get_legislation_sections(legislation_id))
+                amendments = tg.create_task(client.search_amendments(legislation_id))
+        finally:
+            await client.aclose()
+        return {
+            "legislation": legislation.result(),
+            "sections": sections.result(),
+            "amendments": amendments.result(),
+        }
+
+    async def trigger_targeted_ingestion(
+        self,
+        tenant_id: uuid.UUID,
+        *,
+        types: list[str],
+        years: list[int],
+        limit: int | None = None,
+        container: str = INGEST_CONTAINER,
+    ) -> IngestionJob:
+        """Record and queue an ingestion run limited to the given slice."""
+        if self._session is None:
+            raise RuntimeError("trigger_targeted_ingestion requires a database session")
+        command = build_ingestion_command(container, types=types, years=years, limit=limit)
+        job = IngestionJob(tenant_id=tenant_id, command=command)
+        self._session.add(job)
+        await self._session.flush()
+        await enqueue_ingestion(job.id, command)
+        logger.info(
+            "targeted_ingestion_triggered",
+            tenant_id=str(tenant_id),
+            job_id=str(job.id),
+            types=types,
+            years=years,
+        )
+        return job
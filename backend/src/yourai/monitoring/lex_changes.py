@@ -0,0 +1,109 @@
+"""Weekly change detection over the Lex legislation index.
+
+Snapshots of the index statistics are persisted between runs; the weekly
+check diffs the current statistics against the most recent snapshot.
+Storage is behind a small protocol so tests (or ephemeral deployments)
+can keep snapshots in memory instead of on disk.
+"""
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Protocol, cast
+
+import orjson
+import structlog
+
+from yourai.monitoring.lex_client import LexRestClient
+
+logger = structlog.get_logger(__name__)
+
+
+class SnapshotStore(Protocol):
+    def write(self, name: str, data: bytes) -> None: ...
+
+    def read(self, name: str) -> bytes: ...
+
+    def iter_names(self) -> Iterator[str]: ...
+
+
+class FileSnapshotStore:
+    """Snapshots as JSON files under one directory (production default)."""
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+        root.mkdir(parents=True, exist_ok=True)
+
+    def write(self, name: str, data: bytes) -> None:
+        (self._root / f"{name}.json").write_bytes(data)
+
+    def read(self, name: str) -> bytes:
+        return (self._root / f"{name}.json").read_bytes()
+
+    def iter_names(self) -> Iterator[str]:
+        return (path.stem for path in sorted(self._root.glob("*.json")))
+
+
+class MemorySnapshotStore:
+    """Dict-backed store — no filesystem I/O."""
+
+    def __init__(self) -> None:
+        self._snapshots: dict[str, bytes] = {}
+
+    def write(self, name: str, data: bytes) -> None:
+        self._snapshots[name] = data
+
+    def read(self, name: str) -> bytes:
+        return self._snapshots[name]
+
+    def iter_names(self) -> Iterator[str]:
+        return iter(sorted(self._snapshots))
+
+
+class LexChangeDetector:
+    """Detects movement in the legislation index between snapshots."""
+
+    def __init__(self, store: SnapshotStore | Path, client: LexRestClient) -> None:
+        self._store: SnapshotStore = FileSnapshotStore(store) if isinstance(store, Path) else store
+        self._client = client
+
+    async def download_snapshot(self, name: str | None = None) -> str:
+        """Persist the current index statistics under the given name."""
+        stats = await self._client.get_stats()
+        name = name or datetime.now(UTC).strftime("%Y-%m-%d")
+        self._store.write(name, orjson.dumps(stats))
+        return name
+
+    def load_snapshot(self, name: str) -> dict[str, Any]:
+        # orjson.loads returns Any; snapshots are always JSON objects.
+        return cast(dict[str, Any], orjson.loads(self._store.read(name)))
+
+    def latest_snapshot_name(self) -> str | None:
+        return max(self._store.iter_names(), default=None)
+
+    async def weekly_check(self) -> dict[str, Any]:
+        """Diff current statistics against the latest snapshot, then snapshot.
+
+        The first ever run records a baseline and reports no changes.
+        """
+        previous_name = self.latest_snapshot_name()
+        if previous_name is None:
+            name = await self.download_snapshot()
+            logger.info("lex_baseline_recorded", snapshot=name)
+            return {"baseline": True, "changes": {}}
+        previous = self.load_snapshot(previous_name)
+        stats = await self._client.get_stats()
+        changes = {
+            key: count - previous.get(key, 0)
+            for key, count in stats.items()
+            if count != previous.get(key, 0)
+        }
+        current_name = datetime.now(UTC).strftime("%Y-%m-%d")
+        self._store.write(current_name, orjson.dumps(stats))
+        logger.info(
+            "lex_weekly_check",
+            previous=previous_name,
+            current=current_name,
+            changed_types=sorted(changes),
+        )
+        return {"baseline": False, "previous": previous_name, "changes": changes}
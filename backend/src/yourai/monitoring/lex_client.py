@@ -0,0 +1,116 @@
+"""REST client for the Lex legislation API.
+
+The same client speaks to both the self-hosted primary and the public
+fallback — only the base URL differs. Failover between the two is the
+job of :class:`yourai.monitoring.lex_health.LexHealthManager`.
+"""
+
+from typing import Any, cast
+
+import httpx
+from pydantic import BaseModel
+
+DEFAULT_TIMEOUT = 30.0
+
+
+class Legislation(BaseModel):
+    id: str
+    title: str
+    type: str
+    year: int
+
+
+class LegislationSection(BaseModel):
+    id: str
+    number: str
+    title: str
+
+
+class Amendment(BaseModel):
+    id: str
+    affected_id: str
+    description: str
+
+
+class LexRestClient:
+    """Thin async wrapper over the Lex REST endpoints."""
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.base_url = base_url
+        self._client = httpx.AsyncClient(base_url=base_url, timeout=timeout, transport=transport)
+
+    async def health(self) -> bool:
+        response = await self._client.get("/health")
+        return response.status_code == 200
+
+    async def lookup_legislation(self, legislation_id: str) -> Legislation:
+        response = await self._client.post("/legislation/lookup", json={"id": legislation_id})
+        response.raise_for_status()
+        return Legislation.model_validate(response.json())
+
+    async def get_legislation_sections(self, legislation_id: str) -> list[LegislationSection]:
+        response = await self._client.post(
+            "/legislation/sections", json={"id": legislation_id}
+        )
+        response.raise_for_status()
+        return [LegislationSection.model_validate(item) for item in response.json()["items"]]
+
+    async def search_amendments(self, legislation_id: str) -> list[Amendment]:
+        response = await self._client.post(
+            "/amendments/search", json={"affected_id": legislation_id}
+        )
+        response.raise_for_status()
+        return [Amendment.model_validate(item) for item in response.json()["items"]]
+
+    async def search(
+        self,
+        query: str,
+        *,
+        type: str | None = None,
+        year: int | None = None,
+        limit: int = 20,
+    ) -> list[Legislation]:
+        payload: dict[str, Any] = {"query": query, "limit": limit}
+        if type is not None:
+            payload["type"] = type
+        if year is not None:
+            payload["year"] = year
+        response = await self._client.post("/legislation/search", json=payload)
+        response.raise_for_status()
+        return [Legislation.model_validate(item) for item in response.json()["items"]]
+
+    async def scroll_legislation(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: int = 100,
+        **filters: Any,
+    ) -> tuple[list[Legislation], str | None]:
+        """One page of the legislation index plus the cursor for the next."""
+        payload: dict[str, Any] = {"limit": limit, **filters}
+        if cursor is not None:
+            payload["cursor"] = cursor
+        response = await self._client.post("/legislation/scroll", json=payload)
+        response.raise_for_status()
+        body = response.json()["result"]
+        items = [Legislation.model_validate(item) for item in body["items"]]
+        return items, body.get("next_cursor")
+
+    async def count_by_filter(self, **filters: Any) -> int:
+        response = await self._client.post("/legislation/count", json=filters)
+        response.raise_for_status()
+        return int(response.json()["result"]["count"])
+
+    async def get_stats(self) -> dict[str, int]:
+        """Document counts in the index, keyed by legislation type."""
+        response = await self._client.get("/stats")
+        response.raise_for_status()
+        return cast(dict[str, int], response.json()["result"])
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,67 @@
+"""Health tracking and failover between the two Lex deployments.
+
+The self-hosted Lex stack is primary; the public API is the fallback.
+"""
+
+import httpx
+import structlog
+
+from yourai.monitoring.lex_client import LexRestClient
+
+logger = structlog.get_logger(__name__)
+
+
+class LexHealthManager:
+    """Decides which Lex deployment requests should currently target."""
+
+    def __init__(self, primary: LexRestClient, fallback: LexRestClient) -> None:
+        self._primary = primary
+        self._fallback = fallback
+        self._using_fallback = False
+        self._consecutive_failures = 0
+
+    @property
+    def using_fallback(self) -> bool:
+        return self._using_fallback
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Primary probe failures since the last successful probe."""
+        return self._consecutive_failures
+
+    @property
+    def active_client(self) -> LexRestClient:
+        return self._fallback if self._using_fallback else self._primary
+
+    @property
+    def active_base_url(self) -> str:
+        return self.active_client.base_url
+
+    async def check_health(self) -> bool:
+        """Probe the primary, failing over to the fallback if it is down."""
+        try:
+            if await self._primary.health():
+                self._using_fallback = False
+                self._consecutive_failures = 0
+                return True
+        except httpx.HTTPError:
+            pass
+        self._consecutive_failures += 1
+        logger.warning(
+            "lex_primary_unhealthy",
+            fallback_url=self._fallback.base_url,
+            consecutive_failures=self._consecutive_failures,
+        )
+        self._using_fallback = True
+        try:
+            return await self._fallback.health()
+        except httpx.HTTPError:
+            return False
+
+    def force_primary(self) -> None:
+        """Pin traffic back to the self-hosted deployment."""
+        self._using_fallback = False
+
+    def force_fallback(self) -> None:
+        """Pin traffic to the public API, e.g. during planned maintenance."""
+        self._using_fallback = True
@@ -0,0 +1,33 @@
+"""Status client for the Qdrant instance backing the self-hosted Lex stack."""
+
+from typing import Any
+
+import httpx
+
+DEFAULT_TIMEOUT = 10.0
+
+
+class LexQdrantStatusClient:
+    """Read-only view of the Lex Qdrant collections for the admin dashboard."""
+
+    def __init__(self, base_url: str = "http://localhost:6333") -> None:
+        self.base_url = base_url
+        self._client = httpx.AsyncClient(base_url=base_url, timeout=DEFAULT_TIMEOUT)
+
+    async def list_collections(self) -> list[dict[str, Any]]:
+        """Every collection with its point count and cluster status."""
+        response = await self._client.get("/collections")
+        response.raise_for_status()
+        names = [c["name"] for c in response.json()["result"]["collections"]]
+        collections = []
+        for name in names:
+            detail = await self._client.get(f"/collections/{name}")
+            detail.raise_for_status()
+            result = detail.json()["result"]
+            collections.append(
+                {"name": name, "points": result["points_count"], "status": result["status"]}
+            )
+        return collections
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,79 @@
+"""Background tasks for Lex ingestion runs."""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from yourai.monitoring.models import IngestionJob, IngestionJobStatus
+
+logger = structlog.get_logger(__name__)
+
+
+#: Fixed part of every ingestion invocation, built once at import.
+_CMD_PREFIX: tuple[str, ...] = ("python", "-m", "lex.ingest", "--mode", "legislation-unified")
+
+
+def build_ingestion_command(
+    container: str,
+    *,
+    types: list[str],
+    years: list[int],
+    limit: int | None = None,
+) -> list[str]:
+    """Build the docker-exec command for a targeted ingestion run."""
+    command = ["docker", "exec", container, *_CMD_PREFIX]
+    command.extend(["--types", ",".join(types)])
+    command.extend(["--years", ",".join(str(year) for year in years)])
+    if limit is not None:
+        command.extend(["--limit", str(limit)])
+    return command
+
+
+async def enqueue_ingestion(job_id: uuid.UUID, command: list[str]) -> None:
+    """Queue an ingestion run for the worker. Stub until Celery wiring lands."""
+    logger.info("ingestion_queued", job_id=str(job_id), command=command)
+
+
+async def _run_ingestion(
+    job_id: uuid.UUID,
+    tenant_id: uuid.UUID,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Execute a queued ingestion job and record its lifecycle on the row.
+
+    ``tenant_id`` is passed by the enqueueing request and validated
+    against the row — background tasks never trust a bare job id.
+    """
+    log = logger.bind(tenant_id=str(tenant_id), job_id=str(job_id))
+    async with session_factory() as session:
+        job = (
+            await session.execute(
+                select(IngestionJob).where(
+                    IngestionJob.id == job_id, IngestionJob.tenant_id == tenant_id
+                )
+            )
+        ).scalar_one()
+        job.status = IngestionJobStatus.RUNNING
+        job.started_at = datetime.now(UTC)
+        await session.commit()
+        process = await asyncio.create_subprocess_exec(
+            *job.command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        assert process.stdout is not None  # guaranteed by stdout=PIPE
+        async for line in process.stdout:
+            log.debug("ingestion_output", line=line.decode(errors="replace").rstrip())
+        returncode = await process.wait()
+        if returncode == 0:
+            job.status = IngestionJobStatus.SUCCEEDED
+        else:
+            job.status = IngestionJobStatus.FAILED
+            job.error_message = f"Ingestion exited with code {returncode}"
+            log.error("ingestion_failed", returncode=returncode)
+        job.completed_at = datetime.now(UTC)
+        await session.commit()
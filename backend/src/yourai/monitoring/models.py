@@ -0,0 +1,35 @@
+"""Monitoring models — Lex ingestion jobs."""
+
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Enum, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from yourai.core.database import Base, uuid7
+from yourai.core.models import TimestampMixin
+
+
+class IngestionJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class IngestionJob(TimestampMixin, Base):
+    """A targeted Lex ingestion run requested by a tenant administrator."""
+
+    __tablename__ = "ingestion_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"), index=True)
+    command: Mapped[list[str]] = mapped_column(JSON)
+    status: Mapped[IngestionJobStatus] = mapped_column(
+        Enum(IngestionJobStatus, native_enum=False, length=31),
+        default=IngestionJobStatus.QUEUED,
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+    error_message: Mapped[str | None] = mapped_column(String(1023), default=None)
@@ -0,0 +1 @@
+"""Policy review, ontology and compliance."""
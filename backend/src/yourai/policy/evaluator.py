@@ -0,0 +1,98 @@
+"""Policy document evaluation against a definition's criteria."""
+
+import uuid
+from typing import Any
+
+import structlog
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from yourai.core.config import get_settings
+from yourai.knowledge.search import SearchService
+from yourai.policy.models import PolicyDefinition
+
+logger = structlog.get_logger(__name__)
+
+_MAX_RESPONSE_TOKENS = 1024
+
+
+class ReviewOutcome(BaseModel):
+    """Structured verdict parsed from the analysis model's response."""
+
+    rating: str
+    justification: str
+    citations: list[str] = Field(default_factory=list)
+    recommendations: list[str] = Field(default_factory=list)
+
+
+class PolicyEvaluator:
+    """Evaluates one document against a policy definition.
+
+    Supporting context is retrieved from the tenant's knowledge bases
+    (hybrid search) and, when a Lex client is supplied, from the
+    referenced legislation.
+    """
+
+    def __init__(
+        self,
+        anthropic_client: Any,
+        session: AsyncSession,
+        *,
+        lex_client: Any = None,
+        search_service: Any = None,
+    ) -> None:
+        self._anthropic = anthropic_client
+        self._lex = lex_client
+        self._search = search_service if search_service is not None else SearchService(session)
+
+    async def evaluate(
+        self, tenant_id: uuid.UUID, definition: PolicyDefinition, document_text: str
+    ) -> tuple[ReviewOutcome, int, int]:
+        """Return the outcome plus (input, output) token usage."""
+        contexts = await self._search.hybrid_search(tenant_id, definition.name, limit=5)
+        sections: list[Any] = []
+        if self._lex is not None and definition.legislation_references:
+            sections = await self._lex.search_legislation_sections(
+                [reference.legislation_id for reference in definition.legislation_references]
+            )
+        prompt = self._build_prompt(definition, document_text, contexts, sections)
+        response = await self._anthropic.messages.create(
+            model=get_settings().anthropic_model_analysis,
+            max_tokens=_MAX_RESPONSE_TOKENS,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        outcome = ReviewOutcome.model_validate_json(response.content[0].text)
+        logger.info(
+            "policy_evaluated",
+            tenant_id=str(tenant_id),
+            definition_id=str(definition.id),
+            rating=outcome.rating,
+        )
+        return outcome, response.usage.input_tokens, response.usage.output_tokens
+
+    @staticmethod
+    def _build_prompt(
+        definition: PolicyDefinition,
+        document_text: str,
+        contexts: list[Any],
+        sections: list[Any],
+    ) -> str:
+        lines = [
+            f"Review the following document against the policy '{definition.name}'.",
+            "Respond with JSON: rating, justification, citations, recommendations.",
+            "",
+            "Compliance criteria:",
+        ]
+        lines.extend(f"- {criterion.text}" for criterion in definition.compliance_criteria)
+        if contexts:
+            lines.append("")
+            lines.append("Supporting context:")
+            lines.extend(f"- {context.content}" for context in contexts)
+        if sections:
+            lines.append("")
+            lines.append("Relevant legislation:")
+            lines.extend(f"- {section.title}" for section in sections)
+        lines.append("")
+        lines.append("Document:")
+        lines.append(document_text)
+        return "\n".join(lines)
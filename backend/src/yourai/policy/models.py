@@ -0,0 +1,131 @@
+"""Policy ontology models.
+
+Tenant-scoped tables — every row carries ``tenant_id`` and is covered by
+an RLS policy in its migration. Definitions are the unit of compliance
+review; groups and topics organise them.
+"""
+
+import uuid
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from yourai.core.database import Base, uuid7
+from yourai.core.models import TimestampMixin
+
+policy_definition_topics = Table(
+    "policy_definition_topics",
+    Base.metadata,
+    Column("definition_id", ForeignKey("policy_definitions.id"), primary_key=True),
+    Column("topic_id", ForeignKey("policy_topics.id"), primary_key=True),
+)
+
+
+class PolicyDefinitionGroup(TimestampMixin, Base):
+    __tablename__ = "policy_definition_groups"
+    # Composite indexes: tenant-scoped lookups hit (tenant_id, id)
+    # directly, and the URI uniqueness check is enforced in-database.
+    __table_args__ = (
+        Index("ix_policy_group_tenant_id_id", "tenant_id", "id"),
+        UniqueConstraint("tenant_id", "uri", name="uq_policy_group_tenant_uri"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
+    uri: Mapped[str] = mapped_column(String(255))
+    name: Mapped[str] = mapped_column(String(255))
+    description: Mapped[str | None] = mapped_column(String(1023), default=None)
+
+    definitions: Mapped[list["PolicyDefinition"]] = relationship(back_populates="group")
+
+
+class PolicyTopic(TimestampMixin, Base):
+    __tablename__ = "policy_topics"
+    __table_args__ = (
+        Index("ix_policy_topic_tenant_id_id", "tenant_id", "id"),
+        UniqueConstraint("tenant_id", "uri", name="uq_policy_topic_tenant_uri"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
+    uri: Mapped[str] = mapped_column(String(255))
+    name: Mapped[str] = mapped_column(String(255))
+
+
+class PolicyDefinition(TimestampMixin, Base):
+    __tablename__ = "policy_definitions"
+    __table_args__ = (
+        Index("ix_policy_def_tenant_id_id", "tenant_id", "id"),
+        UniqueConstraint("tenant_id", "uri", name="uq_policy_def_tenant_uri"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
+    group_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("policy_definition_groups.id"), index=True, default=None
+    )
+    uri: Mapped[str] = mapped_column(String(255))
+    name: Mapped[str] = mapped_column(String(255))
+    description: Mapped[str | None] = mapped_column(String(1023), default=None)
+    active: Mapped[bool] = mapped_column(Boolean, default=True)
+
+    group: Mapped[PolicyDefinitionGroup | None] = relationship(back_populates="definitions")
+    topics: Mapped[list[PolicyTopic]] = relationship(secondary=policy_definition_topics)
+    compliance_criteria: Mapped[list["ComplianceCriterion"]] = relationship(
+        back_populates="definition", cascade="all, delete-orphan"
+    )
+    scoring_criteria: Mapped[list["ScoringCriterion"]] = relationship(
+        back_populates="definition", cascade="all, delete-orphan"
+    )
+    legislation_references: Mapped[list["LegislationReference"]] = relationship(
+        back_populates="definition", cascade="all, delete-orphan"
+    )
+
+
+class ComplianceCriterion(TimestampMixin, Base):
+    __tablename__ = "policy_compliance_criteria"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"), index=True)
+    definition_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("policy_definitions.id"), index=True
+    )
+    text: Mapped[str] = mapped_column(String(1023))
+
+    definition: Mapped[PolicyDefinition] = relationship(back_populates="compliance_criteria")
+
+
+class ScoringCriterion(TimestampMixin, Base):
+    __tablename__ = "policy_scoring_criteria"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"), index=True)
+    definition_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("policy_definitions.id"), index=True
+    )
+    text: Mapped[str] = mapped_column(String(1023))
+    weight: Mapped[int] = mapped_column(Integer, default=1)
+
+    definition: Mapped[PolicyDefinition] = relationship(back_populates="scoring_criteria")
+
+
+class LegislationReference(TimestampMixin, Base):
+    __tablename__ = "policy_legislation_references"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"), index=True)
+    definition_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("policy_definitions.id"), index=True
+    )
+    legislation_id: Mapped[str] = mapped_column(String(255))
+
+    definition: Mapped[PolicyDefinition] = relationship(back_populates="legislation_references")
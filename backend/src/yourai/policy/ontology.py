@@ -0,0 +1,294 @@
+"""Policy ontology management service."""
+
+import uuid
+from collections.abc import Sequence
+from typing import cast
+
+import structlog
+from sqlalchemy import insert, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from yourai.core.exceptions import ConflictError, NotFoundError
+from yourai.policy.models import (
+    ComplianceCriterion,
+    LegislationReference,
+    PolicyDefinition,
+    PolicyDefinitionGroup,
+    PolicyTopic,
+    ScoringCriterion,
+)
+from yourai.policy.schemas import CreateDefinition
+
+logger = structlog.get_logger(__name__)
+
+#: Eager-load options for definition reads: batched ``IN`` subselects
+#: instead of a lazy load per collection, which would be 1+N round trips
+#: (and raise under asyncio). Module-level so lambda statements treat
+#: them as a constant part of the cached expression.
+_EAGER_CHILDREN = (
+    selectinload(PolicyDefinition.topics),
+    selectinload(PolicyDefinition.compliance_criteria),
+    selectinload(PolicyDefinition.scoring_criteria),
+    selectinload(PolicyDefinition.legislation_references),
+)
+
+
+class OntologyService:
+    """Manages one tenant's policy ontology: groups, topics, definitions."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    # -- groups ----------------------------------------------------------
+
+    async def create_group(
+        self, tenant_id: uuid.UUID, *, uri: str, name: str, description: str | None = None
+    ) -> PolicyDefinitionGroup:
+        group = PolicyDefinitionGroup(
+            tenant_id=tenant_id, uri=uri, name=name, description=description
+        )
+        await self._insert_unique(group, uri)
+        logger.info("policy_group_created", tenant_id=str(tenant_id), group_id=str(group.id))
+        return group
+
+    async def bulk_create_groups(
+        self, tenant_id: uuid.UUID, items: Sequence[tuple[str, str]]
+    ) -> list[PolicyDefinitionGroup]:
+        """Create several ``(uri, name)`` groups in one INSERT round trip."""
+        result = await self._session.scalars(
+            insert(PolicyDefinitionGroup).returning(
+                PolicyDefinitionGroup, sort_by_parameter_order=True
+            ),
+            [{"tenant_id": tenant_id, "uri": uri, "name": name} for uri, name in items],
+        )
+        groups = list(result)
+        logger.info("policy_groups_bulk_created", tenant_id=str(tenant_id), count=len(groups))
+        return groups
+
+    async def get_group(
+        self, tenant_id: uuid.UUID, group_id: uuid.UUID
+    ) -> PolicyDefinitionGroup:
+        stmt = lambda_stmt(lambda: select(PolicyDefinitionGroup))
+        stmt += lambda s: s.where(
+            PolicyDefinitionGroup.id == group_id,
+            PolicyDefinitionGroup.tenant_id == tenant_id,
+        )
+        # lambda_stmt erases the statement's row type, so cast it back.
+        group = cast(
+            PolicyDefinitionGroup | None,
+            (await self._session.execute(stmt)).scalar_one_or_none(),
+        )
+        if group is None:
+            raise NotFoundError(f"Policy group {group_id} not found")
+        return group
+
+    async def list_groups(self, tenant_id: uuid.UUID) -> list[PolicyDefinitionGroup]:
+        result = await self._session.scalars(
+            select(PolicyDefinitionGroup)
+            .where(PolicyDefinitionGroup.tenant_id == tenant_id)
+            .order_by(PolicyDefinitionGroup.name)
+        )
+        return list(result)
+
+    async def delete_group(self, tenant_id: uuid.UUID, group_id: uuid.UUID) -> None:
+        group = await self.get_group(tenant_id, group_id)
+        await self._session.delete(group)
+        await self._session.flush()
+        logger.info("policy_group_deleted", tenant_id=str(tenant_id), group_id=str(group_id))
+
+    # -- topics ----------------------------------------------------------
+
+    async def create_topic(self, tenant_id: uuid.UUID, *, uri: str, name: str) -> PolicyTopic:
+        topic = PolicyTopic(tenant_id=tenant_id, uri=uri, name=name)
+        await self._insert_unique(topic, uri)
+        logger.info("policy_topic_created", tenant_id=str(tenant_id), topic_id=str(topic.id))
+        return topic
+
+    async def bulk_create_topics(
+        self, tenant_id: uuid.UUID, items: Sequence[tuple[str, str]]
+    ) -> list[PolicyTopic]:
+        """Create several ``(uri, name)`` topics in one INSERT round trip."""
+        result = await self._session.scalars(
+            insert(PolicyTopic).returning(PolicyTopic, sort_by_parameter_order=True),
+            [{"tenant_id": tenant_id, "uri": uri, "name": name} for uri, name in items],
+        )
+        topics = list(result)
+        logger.info("policy_topics_bulk_created", tenant_id=str(tenant_id), count=len(topics))
+        return topics
+
+    async def get_topic(self, tenant_id: uuid.UUID, topic_id: uuid.UUID) -> PolicyTopic:
+        stmt = lambda_stmt(lambda: select(PolicyTopic))
+        stmt += lambda s: s.where(
+            PolicyTopic.id == topic_id, PolicyTopic.tenant_id == tenant_id
+        )
+        topic = cast(
+            PolicyTopic | None, (await self._session.execute(stmt)).scalar_one_or_none()
+        )
+        if topic is None:
+            raise NotFoundError(f"Policy topic {topic_id} not found")
+        return topic
+
+    async def list_topics(self, tenant_id: uuid.UUID) -> list[PolicyTopic]:
+        result = await self._session.scalars(
+            select(PolicyTopic)
+            .where(PolicyTopic.tenant_id == tenant_id)
+            .order_by(PolicyTopic.name)
+        )
+        return list(result)
+
+    async def delete_topic(self, tenant_id: uuid.UUID, topic_id: uuid.UUID) -> None:
+        topic = await self.get_topic(tenant_id, topic_id)
+        await self._session.delete(topic)
+        await self._session.flush()
+        logger.info("policy_topic_deleted", tenant_id=str(tenant_id), topic_id=str(topic_id))
+
+    # -- definitions -----------------------------------------------------
+
+    async def create_definition(
+        self, tenant_id: uuid.UUID, data: CreateDefinition
+    ) -> PolicyDefinition:
+        definition = PolicyDefinition(
+            tenant_id=tenant_id,
+            uri=data.uri,
+            name=data.name,
+            description=data.description,
+            group_id=data.group_id,
+        )
+        for topic_id in data.topic_ids:
+            definition.topics.append(await self.get_topic(tenant_id, topic_id))
+        for text in data.compliance_criteria:
+            definition.compliance_criteria.append(
+                ComplianceCriterion(tenant_id=tenant_id, text=text)
+            )
+        for text in data.scoring_criteria:
+            definition.scoring_criteria.append(ScoringCriterion(tenant_id=tenant_id, text=text))
+        for legislation_id in data.legislation_references:
+            definition.legislation_references.append(
+                LegislationReference(tenant_id=tenant_id, legislation_id=legislation_id)
+            )
+        await self._insert_unique(definition, data.uri)
+        logger.info(
+            "policy_definition_created",
+            tenant_id=str(tenant_id),
+            definition_id=str(definition.id),
+        )
+        return definition
+
+    async def get_definition(
+        self, tenant_id: uuid.UUID, definition_id: uuid.UUID
+    ) -> PolicyDefinition:
+        stmt = lambda_stmt(lambda: select(PolicyDefinition).options(*_EAGER_CHILDREN))
+        stmt += lambda s: s.where(
+            PolicyDefinition.id == definition_id,
+            PolicyDefinition.tenant_id == tenant_id,
+        )
+        definition = cast(
+            PolicyDefinition | None,
+            (await self._session.execute(stmt)).scalar_one_or_none(),
+        )
+        if definition is None:
+            raise NotFoundError(f"Policy definition {definition_id} not found")
+        return definition
+
+    async def list_definitions(
+        self, tenant_id: uuid.UUID, *, group_id: uuid.UUID | None = None
+    ) -> list[PolicyDefinition]:
+        stmt = (
+            select(PolicyDefinition)
+            .options(*_EAGER_CHILDREN)
+            .where(PolicyDefinition.tenant_id == tenant_id)
+            .order_by(PolicyDefinition.name)
+        )
+        if group_id is not None:
+            stmt = stmt.where(PolicyDefinition.group_id == group_id)
+        return list(await self._session.scalars(stmt))
+
+    async def delete_definition(self, tenant_id: uuid.UUID, definition_id: uuid.UUID) -> None:
+        definition = await self.get_definition(tenant_id, definition_id)
+        await self._session.delete(definition)
+        await self._session.flush()
+        logger.info(
+            "policy_definition_deleted",
+            tenant_id=str(tenant_id),
+            definition_id=str(definition_id),
+        )
+
+    async def seed_definitions(
+        self, tenant_id: uuid.UUID, seeds: list[CreateDefinition]
+    ) -> list[PolicyDefinition]:
+        """Insert the given definitions, skipping URIs that already exist.
+
+        Flat seeds (no topics or criteria) go through one
+        ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` statement, with
+        duplicate detection done in-database on the unique
+        ``(tenant_id, uri)`` constraint; seeds carrying children fall
+        back to per-row creation.
+        """
+        created: list[PolicyDefinition] = []
+        flat = [seed for seed in seeds if self._is_flat(seed)]
+        if flat:
+            insert_stmt = (
+                pg_insert(PolicyDefinition)
+                if self._session.bind.dialect.name == "postgresql"
+                else sqlite_insert(PolicyDefinition)
+            )
+            stmt = insert_stmt.on_conflict_do_nothing(
+                index_elements=["tenant_id", "uri"]
+            ).returning(PolicyDefinition)
+            result = await self._session.scalars(
+                stmt,
+                [
+                    {
+                        "tenant_id": tenant_id,
+                        "uri": seed.uri,
+                        "name": seed.name,
+                        "description": seed.description,
+                        "group_id": seed.group_id,
+                    }
+                    for seed in flat
+                ],
+            )
+            created.extend(result)
+        for seed in seeds:
+            if self._is_flat(seed):
+                continue
+            try:
+                created.append(await self.create_definition(tenant_id, seed))
+            except ConflictError:
+                continue
+        logger.info(
+            "policy_definitions_seeded",
+            tenant_id=str(tenant_id),
+            requested=len(seeds),
+            created=len(created),
+        )
+        return created
+
+    @staticmethod
+    def _is_flat(seed: CreateDefinition) -> bool:
+        return not (
+            seed.topic_ids
+            or seed.compliance_criteria
+            or seed.scoring_criteria
+            or seed.legislation_references
+        )
+
+    async def _insert_unique(self, obj: object, uri: str) -> None:
+        """Insert ``obj``, translating a duplicate-URI violation.
+
+        One round trip on the success path instead of SELECT-then-INSERT,
+        and correct under concurrent creation: the unique
+        ``(tenant_id, uri)`` constraint arbitrates in-database. The
+        SAVEPOINT keeps the session usable after a rejected insert.
+        """
+        try:
+            async with self._session.begin_nested():
+                self._session.add(obj)
+        except IntegrityError as exc:
+            if "uri" not in str(exc.orig).lower():
+                raise
+            raise ConflictError(f"URI {uri} already exists") from exc
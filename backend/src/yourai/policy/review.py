@@ -0,0 +1,174 @@
+"""Policy review engine and state machine.
+
+A review takes one document through evaluation against a policy
+definition: ``PENDING → PROCESSING → COMPLETE`` on the happy path, with
+``CANCELLED`` reachable until the review completes and ``ERROR``
+terminal on failure. Progress events fan out to subscribers over Redis.
+"""
+
+import enum
+import uuid
+from typing import Any
+
+import orjson
+import structlog
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column, selectinload
+
+from yourai.core.database import Base, uuid7
+from yourai.core.exceptions import NotFoundError
+from yourai.core.models import TimestampMixin
+from yourai.policy.evaluator import PolicyEvaluator
+from yourai.policy.models import PolicyDefinition
+
+logger = structlog.get_logger(__name__)
+
+#: Progress events are trimmed to this window (seconds) per tenant.
+PROGRESS_TTL_SECONDS = 3600
+
+
+class PolicyReviewState(str, enum.Enum):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETE = "complete"
+    CANCELLED = "cancelled"
+    ERROR = "error"
+
+
+#: States a review can still be cancelled from.
+_CANCELLABLE = frozenset({PolicyReviewState.PENDING, PolicyReviewState.PROCESSING})
+
+
+class PolicyReview(TimestampMixin, Base):
+    __tablename__ = "policy_reviews"
+    __table_args__ = (Index("ix_policy_review_tenant_id_id", "tenant_id", "id"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
+    definition_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("policy_definitions.id"), index=True
+    )
+    state: Mapped[PolicyReviewState] = mapped_column(
+        Enum(PolicyReviewState, native_enum=False, length=31),
+        default=PolicyReviewState.PENDING,
+    )
+    rating: Mapped[str | None] = mapped_column(String(31), default=None)
+    justification: Mapped[str | None] = mapped_column(String(4095), default=None)
+    input_tokens: Mapped[int] = mapped_column(Integer, default=0)
+    output_tokens: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class PolicyReviewEngine:
+    """Runs policy reviews and owns their state transitions."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        redis: Any,
+        anthropic_client: Any,
+        lex_client: Any = None,
+        search_service: Any = None,
+    ) -> None:
+        self._session = session
+        self._redis = redis
+        self._evaluator = PolicyEvaluator(
+            anthropic_client, session, lex_client=lex_client, search_service=search_service
+        )
+
+    async def start_review(
+        self, tenant_id: uuid.UUID, definition_id: uuid.UUID, document_text: str
+    ) -> PolicyReview:
+        """Create a review, evaluate the document and record the outcome."""
+        review = PolicyReview(tenant_id=tenant_id, definition_id=definition_id)
+        self._session.add(review)
+        await self._session.flush()
+        log = logger.bind(tenant_id=str(tenant_id), review_id=str(review.id))
+        try:
+            definition = await self._get_definition(tenant_id, definition_id)
+            review.state = PolicyReviewState.PROCESSING
+            await self._session.flush()
+            await self._publish_progress(tenant_id, review.id, PolicyReviewState.PROCESSING)
+            outcome, input_tokens, output_tokens = await self._evaluator.evaluate(
+                tenant_id, definition, document_text
+            )
+        except Exception:
+            review.state = PolicyReviewState.ERROR
+            await self._session.flush()
+            log.error("policy_review_failed")
+            raise
+        review.state = PolicyReviewState.COMPLETE
+        review.rating = outcome.rating
+        review.justification = outcome.justification
+        review.input_tokens = input_tokens
+        review.output_tokens = output_tokens
+        await self._session.flush()
+        await self._publish_progress(tenant_id, review.id, PolicyReviewState.COMPLETE)
+        log.info(
+            "policy_review_complete",
+            rating=outcome.rating,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+        )
+        return review
+
+    async def cancel_review(self, tenant_id: uuid.UUID, review_id: uuid.UUID) -> PolicyReview:
+        """Cancel a review that has not yet completed; no-op otherwise."""
+        review = await self.get_review(tenant_id, review_id)
+        if review.state not in _CANCELLABLE:
+            return review
+        review.state = PolicyReviewState.CANCELLED
+        await self._session.flush()
+        await self._publish_progress(tenant_id, review_id, PolicyReviewState.CANCELLED)
+        logger.info(
+            "policy_review_cancelled", tenant_id=str(tenant_id), review_id=str(review_id)
+        )
+        return review
+
+    async def get_review(self, tenant_id: uuid.UUID, review_id: uuid.UUID) -> PolicyReview:
+        review = (
+            await self._session.execute(
+                select(PolicyReview).where(
+                    PolicyReview.id == review_id, PolicyReview.tenant_id == tenant_id
+                )
+            )
+        ).scalar_one_or_none()
+        if review is None:
+            raise NotFoundError(f"Policy review {review_id} not found")
+        return review
+
+    async def _get_definition(
+        self, tenant_id: uuid.UUID, definition_id: uuid.UUID
+    ) -> PolicyDefinition:
+        # Eager-load the children the evaluator reads — lazy loads raise
+        # MissingGreenlet under the async session.
+        definition = (
+            await self._session.execute(
+                select(PolicyDefinition)
+                .options(
+                    selectinload(PolicyDefinition.compliance_criteria),
+                    selectinload(PolicyDefinition.legislation_references),
+                )
+                .where(
+                    PolicyDefinition.id == definition_id,
+                    PolicyDefinition.tenant_id == tenant_id,
+                )
+            )
+        ).scalar_one_or_none()
+        if definition is None:
+            raise NotFoundError(f"Policy definition {definition_id} not found")
+        return definition
+
+    async def _publish_progress(
+        self, tenant_id: uuid.UUID, review_id: uuid.UUID, state: PolicyReviewState
+    ) -> None:
+        """Fan a progress event out over one pipelined round trip."""
+        key = f"tenant:{tenant_id}:review-progress"
+        event = orjson.dumps({"review_id": str(review_id), "state": state.value})
+        timestamp = float(review_id.int >> 80)  # uuid7 ms timestamp, monotonic enough
+        pipe = self._redis.pipeline()
+        pipe.zadd(key, {event: timestamp})
+        pipe.zremrangebyscore(key, 0, timestamp - PROGRESS_TTL_SECONDS * 1000)
+        pipe.expire(key, PROGRESS_TTL_SECONDS)
+        pipe.publish(f"tenant:{tenant_id}:reviews", event)
+        await pipe.execute()
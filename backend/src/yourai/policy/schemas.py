@@ -0,0 +1,16 @@
+"""Schemas for policy-ontology operations."""
+
+import uuid
+
+from pydantic import BaseModel, Field
+
+
+class CreateDefinition(BaseModel):
+    uri: str = Field(min_length=1, max_length=255)
+    name: str = Field(min_length=1, max_length=255)
+    description: str | None = Field(default=None, max_length=1023)
+    group_id: uuid.UUID | None = None
+    topic_ids: list[uuid.UUID] = Field(default_factory=list)
+    compliance_criteria: list[str] = Field(default_factory=list)
+    scoring_criteria: list[str] = Field(default_factory=list)
+    legislation_references: list[str] = Field(default_factory=list)
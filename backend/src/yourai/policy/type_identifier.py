@@ -0,0 +1,79 @@
+"""Routes an uploaded document to the policy definition it matches."""
+
+import uuid
+from typing import Any
+
+import orjson
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from yourai.core.config import get_settings
+from yourai.policy.models import PolicyDefinition
+
+logger = structlog.get_logger(__name__)
+
+#: The classifier only needs the opening of the document.
+MAX_DOCUMENT_CHARS = 2000
+TRUNCATION_MARKER = "[... document continues ...]"
+
+_MAX_RESPONSE_TOKENS = 255
+
+
+class PolicyTypeIdentifier:
+    """Classifies a document against the tenant's active definitions."""
+
+    def __init__(self, anthropic_client: Any) -> None:
+        self._anthropic = anthropic_client
+
+    async def identify_policy_type(
+        self, session: AsyncSession, tenant_id: uuid.UUID, document_text: str
+    ) -> PolicyDefinition | None:
+        """Return the matching active definition, or None for no match."""
+        definitions = list(
+            await session.scalars(
+                select(PolicyDefinition).where(
+                    PolicyDefinition.tenant_id == tenant_id,
+                    PolicyDefinition.active.is_(True),
+                )
+            )
+        )
+        if not definitions:
+            return None
+        response = await self._anthropic.messages.create(
+            model=get_settings().anthropic_model_classifier,
+            max_tokens=_MAX_RESPONSE_TOKENS,
+            messages=[
+                {"role": "user", "content": self._build_prompt(definitions, document_text)}
+            ],
+        )
+        uri = orjson.loads(response.content[0].text).get("definition_uri")
+        match = next((d for d in definitions if d.uri == uri), None)
+        logger.info(
+            "policy_type_identified",
+            tenant_id=str(tenant_id),
+            definition_uri=match.uri if match else None,
+        )
+        return match
+
+    @staticmethod
+    def _build_prompt(definitions: list[PolicyDefinition], document_text: str) -> str:
+        if len(document_text) > MAX_DOCUMENT_CHARS:
+            document_text = document_text[:MAX_DOCUMENT_CHARS] + "\n" + TRUNCATION_MARKER
+        lines = [
+            "Identify which policy type the document below is.",
+            (
+                'Respond with JSON: {"definition_uri": "<uri>"}'
+                ' or {"definition_uri": null} if none match.'
+            ),
+            "",
+            "Policy types:",
+        ]
+        lines.extend(
+            f"- {definition.uri}: {definition.name} — {definition.description or ''}"
+            for definition in definitions
+        )
+        lines.append("")
+        lines.append("Document:")
+        lines.append(document_text)
+        return "\n".join(lines)
@@ -0,0 +1,45 @@
+"""Fixtures for SSE and API endpoint tests.
+
+The heavyweight pieces (fake Redis, the FastAPI app) are module-scoped
+and the async tests share one event loop per module; an autouse fixture
+flushes Redis between tests to keep them independent.
+"""
+
+import pytest
+import pytest_asyncio
+import uuid_utils
+from fakeredis.aioredis import FakeRedis
+from fastapi import FastAPI
+
+from yourai.api.main import create_app
+from yourai.api.sse.publisher import EventPublisher
+
+
+@pytest.fixture
+def tenant_id() -> str:
+    return str(uuid_utils.uuid7())
+
+
+@pytest.fixture
+def user_id() -> str:
+    return str(uuid_utils.uuid7())
+
+
+@pytest.fixture(scope="module")
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest_asyncio.fixture(loop_scope="module", autouse=True)
+async def _flush_redis(fake_redis: FakeRedis) -> None:
+    await fake_redis.flushall()
+
+
+@pytest.fixture(scope="module")
+def publisher(fake_redis: FakeRedis) -> EventPublisher:
+    return EventPublisher(fake_redis)
+
+
+@pytest.fixture(scope="module")
+def app(fake_redis: FakeRedis) -> FastAPI:
+    return create_app(redis=fake_redis)
@@ -0,0 +1,158 @@
+"""Tests for SSE channels, publishing and streaming."""
+
+import asyncio
+
+import ormsgpack
+import pytest
+import uuid_utils
+
+from yourai.api.sse.channels import SSEChannel
+from yourai.api.sse.events import ContentDeltaEvent, StatusEvent
+from yourai.api.sse.stream import event_stream
+
+
+def _conversation_channel(tenant_id: str) -> SSEChannel:
+    return SSEChannel.for_conversation(tenant_id, str(uuid_utils.uuid7()))
+
+
+class TestSSEChannel:
+    def test_cross_tenant_isolation(self) -> None:
+        conversation_id = str(uuid_utils.uuid7())
+        tenant_a = str(uuid_utils.uuid7())
+        tenant_b = str(uuid_utils.uuid7())
+        channel_a = SSEChannel.for_conversation(tenant_a, conversation_id)
+        channel_b = SSEChannel.for_conversation(tenant_b, conversation_id)
+        assert channel_a.pubsub_key != channel_b.pubsub_key
+        assert channel_a.replay_key != channel_b.replay_key
+        assert tenant_a.encode() in channel_a.pubsub_key
+
+    def test_scopes_do_not_collide(self) -> None:
+        tenant = str(uuid_utils.uuid7())
+        target = str(uuid_utils.uuid7())
+        keys = {
+            SSEChannel.for_conversation(tenant, target).pubsub_key,
+            SSEChannel.for_policy_review(tenant, target).pubsub_key,
+            SSEChannel.for_user(tenant, target).pubsub_key,
+        }
+        assert len(keys) == 3
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestPublish:
+    async def test_publish_stores_in_replay_buffer(self, fake_redis, publisher, tenant_id):
+        channel = _conversation_channel(tenant_id)
+        await publisher.publish(channel, ContentDeltaEvent(text="hello"))
+        entries = await fake_redis.zrangebyscore(channel.replay_key, "-inf", "+inf")
+        assert len(entries) == 1
+        assert ormsgpack.unpackb(entries[0])["event_type"] == "content_delta"
+
+    async def test_publish_returns_event_id(self, publisher, tenant_id):
+        channel = _conversation_channel(tenant_id)
+        event = ContentDeltaEvent(text="hello")
+        assert await publisher.publish(channel, event) == event.event_id
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestEventStream:
+    async def test_publish_event_received_by_stream(self, fake_redis, publisher, tenant_id):
+        channel = _conversation_channel(tenant_id)
+        data_frames: list[str] = []
+
+        async def consume(ready: asyncio.Event) -> None:
+            async for frame in event_stream(fake_redis, channel, ready=ready):
+                if "data:" in frame:
+                    data_frames.append(frame)
+                    break
+
+        ready = asyncio.Event()
+        consumer_task = asyncio.create_task(consume(ready))
+        await ready.wait()
+        await publisher.publish(channel, ContentDeltaEvent(text="hello"))
+        await asyncio.wait_for(consumer_task, timeout=2)
+        assert len(data_frames) == 1
+        assert "hello" in data_frames[0]
+
+    async def test_cross_tenant_event_isolation_stream(self, fake_redis, publisher):
+        conversation_id = str(uuid_utils.uuid7())
+        channel_a = SSEChannel.for_conversation(str(uuid_utils.uuid7()), conversation_id)
+        channel_b = SSEChannel.for_conversation(str(uuid_utils.uuid7()), conversation_id)
+        data_frames: list[str] = []
+
+        async def consume(ready: asyncio.Event) -> None:
+            async for frame in event_stream(fake_redis, channel_a, ready=ready):
+                if "data:" in frame:
+                    data_frames.append(frame)
+                    break
+
+        ready = asyncio.Event()
+        consumer_task = asyncio.create_task(consume(ready))
+        await ready.wait()
+        await publisher.publish(channel_b, ContentDeltaEvent(text="other tenant"))
+        await publisher.publish(channel_a, ContentDeltaEvent(text="own tenant"))
+        await asyncio.wait_for(consumer_task, timeout=2)
+        assert len(data_frames) == 1
+        assert "own tenant" in data_frames[0]
+        assert "other tenant" not in data_frames[0]
+
+    async def test_user_push_event_stream(self, fake_redis, publisher, tenant_id, user_id):
+        channel = SSEChannel.for_user(tenant_id, user_id)
+        data_frames: list[str] = []
+
+        async def consume(ready: asyncio.Event) -> None:
+            async for frame in event_stream(fake_redis, channel, ready=ready):
+                if "data:" in frame:
+                    data_frames.append(frame)
+                    break
+
+        ready = asyncio.Event()
+        consumer_task = asyncio.create_task(consume(ready))
+        await ready.wait()
+        await publisher.publish(channel, StatusEvent(status="document_ready"))
+        await asyncio.wait_for(consumer_task, timeout=2)
+        assert "document_ready" in data_frames[0]
+
+    async def test_sse_frame_format(self, fake_redis, publisher, tenant_id):
+        channel = _conversation_channel(tenant_id)
+        data_frames: list[str] = []
+
+        async def consume(ready: asyncio.Event) -> None:
+            async for frame in event_stream(fake_redis, channel, ready=ready):
+                if "data:" in frame:
+                    data_frames.append(frame)
+                    break
+
+        ready = asyncio.Event()
+        consumer_task = asyncio.create_task(consume(ready))
+        await ready.wait()
+        event = ContentDeltaEvent(text="hello")
+        await publisher.publish(channel, event)
+        await asyncio.wait_for(consumer_task, timeout=2)
+        frame = data_frames[0]
+        assert frame.startswith(f"id: {event.event_id}\n")
+        assert "\nevent: content_delta\n" in frame
+        assert "\ndata: " in frame
+        assert frame.endswith("\n\n")
+
+    async def test_reconnection_replays_missed_events(self, fake_redis, publisher, tenant_id):
+        channel = _conversation_channel(tenant_id)
+        # The publishes are independent, so pipeline them; uuid7 event ids
+        # must still come out strictly increasing.
+        id1, id2, id3 = await asyncio.gather(
+            publisher.publish(channel, ContentDeltaEvent(text="one")),
+            publisher.publish(channel, ContentDeltaEvent(text="two")),
+            publisher.publish(channel, ContentDeltaEvent(text="three")),
+        )
+        assert id1 < id2 < id3
+
+        data_frames: list[str] = []
+
+        async def consume() -> None:
+            async for frame in event_stream(fake_redis, channel, last_event_id=id1):
+                if "data:" in frame:
+                    data_frames.append(frame)
+                if len(data_frames) == 2:
+                    break
+
+        await asyncio.wait_for(consume(), timeout=2)
+        assert "two" in data_frames[0]
+        assert "three" in data_frames[1]
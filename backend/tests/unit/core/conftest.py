@@ -0,0 +1,19 @@
+"""Fixtures for core model and service tests."""
+
+import uuid
+
+import pytest
+
+from yourai.core.database import uuid7
+
+
+@pytest.fixture
+def tenant_id() -> uuid.UUID:
+    # uuid7 keeps test primary keys time-ordered, matching production and
+    # keeping B-tree inserts append-mostly when a real database is used.
+    return uuid7()
+
+
+@pytest.fixture
+def user_id() -> uuid.UUID:
+    return uuid7()
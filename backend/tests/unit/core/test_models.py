@@ -0,0 +1,59 @@
+"""Tests for core tenant, user and RBAC models."""
+
+import pytest
+from sqlalchemy import select
+
+from yourai.core.database import uuid7
+from yourai.core.models import Permission, Role, Tenant, User, UserStatus
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_tenant_creation(test_session, tenant_id):
+    tenant = Tenant(id=tenant_id, name="Model Test", slug="model-test")
+    test_session.add(tenant)
+    await test_session.flush()
+
+    fetched = await test_session.get(Tenant, tenant_id)
+    assert fetched is not None
+    assert fetched.slug == "model-test"
+
+
+async def test_tenant_id_defaults_to_uuid7(test_session):
+    tenant = Tenant(name="Default Id", slug="default-id")
+    test_session.add(tenant)
+    await test_session.flush()
+    assert tenant.id.version == 7
+
+
+async def test_user_creation_with_tenant(test_session, sample_tenant, user_id):
+    user = User(
+        id=user_id,
+        tenant_id=sample_tenant.id,
+        email="jo@example.com",
+        full_name="Jo Bloggs",
+    )
+    test_session.add(user)
+    await test_session.flush()
+
+    fetched = (
+        await test_session.execute(select(User).where(User.id == user_id))
+    ).scalar_one()
+    assert fetched.tenant_id == sample_tenant.id
+    assert fetched.status == UserStatus.INVITED
+
+
+async def test_role_permission_assignment(test_session, sample_tenant):
+    permission = Permission(code="documents:read")
+    role = Role(tenant_id=sample_tenant.id, name="Reviewer", permissions=[permission])
+    test_session.add(role)
+    await test_session.flush()
+
+    fetched = await test_session.get(Role, role.id)
+    assert [p.code for p in fetched.permissions] == ["documents:read"]
+
+
+async def test_uuid7_ids_are_time_ordered():
+    first = uuid7()
+    second = uuid7()
+    assert first < second
@@ -0,0 +1,68 @@
+"""Fixtures for knowledge-module tests."""
+
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from yourai.core.models import Tenant
+from yourai.knowledge.models import KnowledgeBase
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def sample_knowledge_base(db_engine, sample_tenant: Tenant) -> KnowledgeBase:
+    """One knowledge base, committed once per module and shared."""
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        kb = KnowledgeBase(tenant_id=sample_tenant.id, name="Policies")
+        session.add(kb)
+        await session.commit()
+    return kb
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def other_tenant(db_engine) -> Tenant:
+    """A second tenant for isolation tests, committed once per module."""
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        tenant = Tenant(name="Isolation Other", slug="isolation-other")
+        session.add(tenant)
+        await session.commit()
+    return tenant
+
+
+@pytest.fixture(scope="session")
+def long_sentence_text() -> str:
+    """A large document body, built once instead of per test."""
+    return "This is a sentence. " * 200
+
+
+# Extraction tests read a small precompiled corpus from disk (generated by
+# PyMuPDF / python-docx once, committed under tests/fixtures/) so neither
+# library is imported, or a document serialised, on the test path.
+
+FIXTURES_DIR = Path(__file__).resolve().parents[2] / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def simple_pdf_bytes() -> bytes:
+    return (FIXTURES_DIR / "simple.pdf").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def heading_pdf_bytes() -> bytes:
+    return (FIXTURES_DIR / "heading.pdf").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def empty_pdf_bytes() -> bytes:
+    return (FIXTURES_DIR / "empty.pdf").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def simple_docx_bytes() -> bytes:
+    return (FIXTURES_DIR / "simple.docx").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def heading_docx_bytes() -> bytes:
+    return (FIXTURES_DIR / "heading.docx").read_bytes()
@@ -0,0 +1,107 @@
+"""Tests for structure-aware document chunking."""
+
+from dataclasses import fields
+
+import pytest
+
+from yourai.knowledge.chunking import Chunk, chunk_document
+from yourai.knowledge.extraction import Section
+
+SECTIONED_TEXT = (
+    "Data Protection\n"
+    "Personal data must be processed lawfully and transparently.\n"
+    "Retention\n"
+    "Records are kept for six years after the relationship ends."
+)
+SECTIONS = [
+    Section("Data Protection", 0, 76),
+    Section("Retention", 76, len(SECTIONED_TEXT)),
+]
+
+
+#: Sentinel resolved to the session-scoped long_sentence_text fixture.
+LONG = object()
+
+# (id, text, sections, expected chunk count — None means "more than one",
+#  expected set of section headings)
+CASES = [
+    ("empty", "", None, 0, set()),
+    ("short", "This is a short document.", None, 1, {None}),
+    ("sectioned", SECTIONED_TEXT, SECTIONS, 2, {"Data Protection", "Retention"}),
+    ("long-fallback", LONG, None, None, {None}),
+    ("long-section", LONG, "whole-document-section", None, {"Long"}),
+    ("empty-sections", LONG, [], None, {None}),
+]
+
+
+@pytest.fixture(scope="module")
+def chunked_long_text(long_sentence_text):
+    """Chunk the long fixture once for the tests that only inspect the result."""
+    return long_sentence_text, chunk_document(
+        long_sentence_text,
+        sections=None,
+        target_tokens=50,
+        max_tokens=100,
+        overlap_tokens=10,
+    )
+
+
+class TestChunkDocument:
+    @pytest.mark.parametrize(
+        ("name", "text", "sections", "count", "headings"),
+        CASES,
+        ids=[case[0] for case in CASES],
+    )
+    def test_chunk_document_cases(self, request, name, text, sections, count, headings):
+        if text is LONG:
+            text = request.getfixturevalue("long_sentence_text")
+        if sections == "whole-document-section":
+            sections = [Section("Long", 0, len(text))]
+        chunks = chunk_document(
+            text, sections=sections, target_tokens=100, max_tokens=200, overlap_tokens=15
+        )
+        if count is None:
+            assert len(chunks) > 1
+        else:
+            assert len(chunks) == count
+        assert {c.section_heading for c in chunks} == headings
+        if name == "short":
+            assert chunks[0].content == text
+
+    def test_overlap_applied(self, long_sentence_text):
+        chunks = chunk_document(
+            long_sentence_text,
+            sections=None,
+            target_tokens=100,
+            max_tokens=200,
+            overlap_tokens=15,
+        )
+        assert chunks[1].start_byte < chunks[0].end_byte
+
+    def test_chunk_indices_are_sequential(self, chunked_long_text):
+        _, chunks = chunked_long_text
+        assert [c.index for c in chunks] == list(range(len(chunks)))
+
+    def test_byte_ranges_set(self, chunked_long_text):
+        long_sentence_text, chunks = chunked_long_text
+        for chunk in chunks:
+            assert chunk.end_byte > chunk.start_byte
+            raw = long_sentence_text.encode("utf-8")[chunk.start_byte : chunk.end_byte]
+            assert raw.decode("utf-8") == chunk.content
+
+
+#: Fields downstream consumers (embedding, search payloads) rely on.
+EXPECTED_CHUNK_FIELDS = {
+    "content",
+    "index",
+    "token_count",
+    "section_heading",
+    "start_byte",
+    "end_byte",
+}
+
+
+class TestChunk:
+    def test_chunk_is_dataclass(self):
+        # Static shape check via introspection — no instantiation needed.
+        assert {f.name for f in fields(Chunk)} >= EXPECTED_CHUNK_FIELDS
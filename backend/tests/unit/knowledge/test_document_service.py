@@ -0,0 +1,172 @@
+"""Tests for the document upload and lifecycle service."""
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from yourai.core.database import uuid7 as _uuid7
+from yourai.core.exceptions import ValidationError
+from yourai.knowledge.documents import DocumentService
+from yourai.knowledge.models import Document, ProcessingState
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@dataclass
+class DocumentDeps:
+    validate: Mock
+    storage: SimpleNamespace
+    task: AsyncMock
+
+
+def make_storage(
+    hash: str = "abc123hash", save: str = "/uploads/test/doc.pdf"
+) -> SimpleNamespace:
+    """Build a flat storage stub — a bare AsyncMock synthesizes a child mock
+    on every attribute access, which dominates this module's fixture cost."""
+    ns = SimpleNamespace()
+    ns.file_hash = AsyncMock(return_value=hash)
+    ns.save = AsyncMock(return_value=save)
+    ns.delete = AsyncMock()
+    return ns
+
+
+@pytest.fixture(autouse=True)
+def mocked_document_deps(monkeypatch: pytest.MonkeyPatch) -> DocumentDeps:
+    """Stub the service's collaborators once for every test in this module."""
+    validate = Mock(return_value="application/pdf")
+    storage = make_storage()
+    task = AsyncMock()
+    monkeypatch.setattr("yourai.knowledge.documents.validate_upload", validate)
+    monkeypatch.setattr(
+        "yourai.knowledge.documents.LocalFileStorage", Mock(return_value=storage)
+    )
+    monkeypatch.setattr("yourai.knowledge.documents.enqueue_document_processing", task)
+    return DocumentDeps(validate, storage, task)
+
+
+@pytest.fixture
+def service(test_session) -> DocumentService:
+    return DocumentService(test_session)
+
+
+@pytest.fixture
+def document_factory(test_session, sample_tenant, sample_knowledge_base):
+    """Build and flush Document rows without per-test boilerplate."""
+
+    async def _make(**overrides) -> Document:
+        name = overrides.pop("name", "x.pdf")
+        document = Document(
+            id=_uuid7(),
+            tenant_id=sample_tenant.id,
+            knowledge_base_id=sample_knowledge_base.id,
+            name=name,
+            document_uri=overrides.pop("uri", f"/uploads/{sample_tenant.id}/{name}"),
+            **overrides,
+        )
+        test_session.add(document)
+        await test_session.flush()
+        return document
+
+    return _make
+
+
+async def test_upload_document(
+    service, sample_tenant, sample_knowledge_base, mocked_document_deps
+):
+    document = await service.upload_document(
+        sample_tenant.id, sample_knowledge_base.id, "doc.pdf", b"%PDF-1.7 content"
+    )
+
+    assert document.tenant_id == sample_tenant.id
+    assert document.version == 1
+    assert document.content_hash == "abc123hash"
+    assert document.processing_state == ProcessingState.PENDING
+    mocked_document_deps.task.assert_awaited_once_with(document.id, sample_tenant.id)
+
+
+async def test_upload_versioning(service, sample_tenant, sample_knowledge_base):
+    first = await service.upload_document(
+        sample_tenant.id, sample_knowledge_base.id, "doc.pdf", b"%PDF-1.7 v1"
+    )
+    second = await service.upload_document(
+        sample_tenant.id, sample_knowledge_base.id, "doc.pdf", b"%PDF-1.7 v2"
+    )
+
+    assert second.version == 2
+    assert second.previous_version_id == first.id
+
+
+async def test_delete_document(
+    service, sample_tenant, sample_knowledge_base, mocked_document_deps
+):
+    document = await service.upload_document(
+        sample_tenant.id, sample_knowledge_base.id, "doc.pdf", b"%PDF-1.7 content"
+    )
+    await service.delete_document(sample_tenant.id, document.id)
+
+    mocked_document_deps.storage.delete.assert_awaited_once_with("/uploads/test/doc.pdf")
+    versions = await service.get_versions(
+        sample_tenant.id, sample_knowledge_base.id, "doc.pdf"
+    )
+    assert versions == []
+
+
+async def test_get_versions(test_session, service, sample_tenant, sample_knowledge_base):
+    # uuid7 ids are known up front, so both versions (including the FK
+    # between them) go down in one batched flush.
+    v1_id = _uuid7()
+    uri = f"/uploads/{sample_tenant.id}/policy.pdf"
+    test_session.add_all(
+        [
+            Document(
+                id=v1_id,
+                tenant_id=sample_tenant.id,
+                knowledge_base_id=sample_knowledge_base.id,
+                name="policy.pdf",
+                document_uri=uri,
+                version=1,
+            ),
+            Document(
+                id=_uuid7(),
+                tenant_id=sample_tenant.id,
+                knowledge_base_id=sample_knowledge_base.id,
+                name="policy.pdf",
+                document_uri=uri,
+                version=2,
+                previous_version_id=v1_id,
+            ),
+        ]
+    )
+    await test_session.flush()
+
+    versions = await service.get_versions(
+        sample_tenant.id, sample_knowledge_base.id, "policy.pdf"
+    )
+    assert [d.version for d in versions] == [1, 2]
+
+
+async def test_retry_failed(service, sample_tenant, mocked_document_deps, document_factory):
+    document = await document_factory(
+        name="broken.pdf", processing_state=ProcessingState.FAILED, retry_count=1
+    )
+
+    retried = await service.retry_failed(sample_tenant.id, document.id)
+
+    assert retried.processing_state == ProcessingState.PENDING
+    assert retried.retry_count == 2
+    mocked_document_deps.task.assert_awaited_once()
+
+
+async def test_retry_dead_lettered_rejected(service, sample_tenant, document_factory):
+    document = await document_factory(
+        name="broken.pdf",
+        processing_state=ProcessingState.FAILED,
+        retry_count=3,
+        dead_letter=True,
+    )
+
+    with pytest.raises(ValidationError):
+        await service.retry_failed(sample_tenant.id, document.id)
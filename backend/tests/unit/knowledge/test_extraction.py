@@ -0,0 +1,70 @@
+"""Tests for document text extraction."""
+
+import importlib.util
+
+import pytest
+
+from yourai.core.exceptions import ValidationError
+from yourai.knowledge.extraction import DOCX_MIME, extract_text
+
+# Skip the whole module at collection time when PyMuPDF is absent rather
+# than erroring from inside test bodies.
+fitz = pytest.importorskip("fitz")
+
+# python-docx is imported lazily inside the extractor, so the docx tests
+# need their own guard — but only those: a missing python-docx should not
+# skip the PDF and plain-text tests above.
+_HAS_DOCX = importlib.util.find_spec("docx") is not None
+
+
+class TestExtractPdf:
+    def test_simple_pdf(self, simple_pdf_bytes):
+        result = extract_text(simple_pdf_bytes, "application/pdf")
+        assert "Hello compliance world." in result.text
+        assert "deliberately simple" in result.text
+
+    def test_pdf_with_headings(self, heading_pdf_bytes):
+        result = extract_text(heading_pdf_bytes, "application/pdf")
+        assert [s.heading for s in result.sections] == ["Data Protection", "Retention"]
+        first = result.sections[0]
+        assert "processed lawfully" in result.text[first.start : first.end]
+
+    def test_empty_pdf(self, empty_pdf_bytes):
+        result = extract_text(empty_pdf_bytes, "application/pdf")
+        assert result.text == ""
+        assert result.sections == []
+
+    def test_freshly_built_pdf_smoke(self):
+        # The only test that builds a PDF at runtime, so a regression in
+        # the PyMuPDF dependency itself still surfaces here.
+        with fitz.open() as doc:
+            doc.new_page().insert_text((72, 72), "Built at test time.", fontsize=11)
+            data = doc.tobytes()
+        result = extract_text(data, "application/pdf")
+        assert "Built at test time." in result.text
+
+
+@pytest.mark.skipif(not _HAS_DOCX, reason="python-docx is not installed")
+class TestExtractDocx:
+    def test_simple_docx(self, simple_docx_bytes):
+        result = extract_text(simple_docx_bytes, DOCX_MIME)
+        assert "Hello compliance world." in result.text
+
+    def test_docx_with_headings(self, heading_docx_bytes):
+        result = extract_text(heading_docx_bytes, DOCX_MIME)
+        assert [s.heading for s in result.sections] == ["Data Protection", "Retention"]
+
+
+class TestExtractText:
+    def test_plain_text(self):
+        result = extract_text(b"Just some text.", "text/plain")
+        assert result.text == "Just some text."
+        assert result.sections == []
+
+    def test_markdown_headings(self):
+        result = extract_text(b"# Scope\nApplies to everyone.\n", "text/markdown")
+        assert [s.heading for s in result.sections] == ["Scope"]
+
+    def test_unsupported_mime_rejected(self):
+        with pytest.raises(ValidationError):
+            extract_text(b"binary", "application/zip")
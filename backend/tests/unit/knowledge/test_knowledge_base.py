@@ -0,0 +1,115 @@
+"""Tests for the knowledge-base management service."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from yourai.core.database import uuid7
+from yourai.core.exceptions import NotFoundError
+from yourai.knowledge.knowledge_base import KnowledgeBaseService
+from yourai.knowledge.models import Document, ProcessingState
+from yourai.knowledge.schemas import CreateKnowledgeBase
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest.fixture(scope="module")
+def _vector_store_patch():
+    """Install the VectorStore stub once per module.
+
+    A per-test @patch walks sys.modules and installs/removes the
+    attribute every time; one module-scoped monkeypatch does it once.
+    """
+    store_class = Mock(return_value=AsyncMock())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("yourai.knowledge.knowledge_base.VectorStore", store_class)
+        yield store_class
+
+
+@pytest.fixture(autouse=True)
+def vector_store_mock(_vector_store_patch) -> Mock:
+    """The patched VectorStore class, with call state reset per test."""
+    _vector_store_patch.reset_mock()
+    _vector_store_patch.return_value.reset_mock()
+    return _vector_store_patch
+
+
+@pytest.fixture
+def service(test_session) -> KnowledgeBaseService:
+    return KnowledgeBaseService(test_session)
+
+
+def _create(name: str = "Policies") -> CreateKnowledgeBase:
+    return CreateKnowledgeBase(name=name, description="Internal policies", category="policy")
+
+
+def _document(tenant_id, knowledge_base_id, name, state=ProcessingState.PENDING) -> Document:
+    return Document(
+        id=uuid7(),
+        tenant_id=tenant_id,
+        knowledge_base_id=knowledge_base_id,
+        name=name,
+        document_uri=f"/uploads/{tenant_id}/{name}",
+        processing_state=state,
+    )
+
+
+class TestKnowledgeBaseService:
+    async def test_create_knowledge_base(self, vector_store_mock, service, sample_tenant):
+        knowledge_base = await service.create_knowledge_base(sample_tenant.id, _create())
+
+        assert knowledge_base.tenant_id == sample_tenant.id
+        assert knowledge_base.category == "policy"
+        vector_store_mock.assert_called_once_with(sample_tenant.id)
+        vector_store_mock.return_value.ensure_collection.assert_awaited_once()
+
+    async def test_get_knowledge_base(self, service, sample_tenant):
+        created = await service.create_knowledge_base(sample_tenant.id, _create())
+
+        result = await service.get_knowledge_base(sample_tenant.id, created.id)
+
+        assert result.name == "Policies"
+        assert result.category == "policy"
+        assert result.document_count == 0
+
+    async def test_document_count_computed(self, service, test_session, sample_tenant):
+        created = await service.create_knowledge_base(sample_tenant.id, _create())
+        test_session.add_all(
+            [
+                _document(sample_tenant.id, created.id, "a.pdf", ProcessingState.READY),
+                _document(sample_tenant.id, created.id, "b.pdf"),
+            ]
+        )
+        await test_session.flush()
+
+        result = await service.get_knowledge_base(sample_tenant.id, created.id)
+
+        assert result.document_count == 2
+        assert result.ready_document_count == 1
+
+    async def test_list_knowledge_bases(self, service, sample_tenant):
+        beta = await service.create_knowledge_base(sample_tenant.id, _create("Beta"))
+        alpha = await service.create_knowledge_base(sample_tenant.id, _create("Alpha"))
+
+        listed = await service.list_knowledge_bases(sample_tenant.id)
+
+        # The shared sample_knowledge_base row may also be present, so
+        # only assert on the rows this test created.
+        ours = [kb.name for kb in listed if kb.id in {alpha.id, beta.id}]
+        assert ours == ["Alpha", "Beta"]
+
+    async def test_tenant_isolation(self, service, sample_tenant, other_tenant):
+        created = await service.create_knowledge_base(sample_tenant.id, _create())
+
+        with pytest.raises(NotFoundError):
+            await service.get_knowledge_base(other_tenant.id, created.id)
+        assert await service.list_knowledge_bases(other_tenant.id) == []
+
+    async def test_delete_knowledge_base(self, vector_store_mock, service, sample_tenant):
+        created = await service.create_knowledge_base(sample_tenant.id, _create())
+
+        await service.delete_knowledge_base(sample_tenant.id, created.id)
+
+        vector_store_mock.return_value.delete_points.assert_awaited_once_with(created.id)
+        with pytest.raises(NotFoundError):
+            await service.get_knowledge_base(sample_tenant.id, created.id)
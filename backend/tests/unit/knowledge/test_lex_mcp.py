@@ -0,0 +1,77 @@
+"""Tests for the Lex MCP client."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from yourai.knowledge.lex_mcp import LexMcpClient
+
+
+@pytest.fixture(scope="module")
+def client() -> LexMcpClient:
+    return LexMcpClient("http://lex:8080/mcp")
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(client):
+    client._session = None
+    client._session_cm = None
+    client._transport_cm = None
+
+
+@pytest.fixture
+def mcp_session(monkeypatch) -> AsyncMock:
+    """Stub the MCP transport and session stack once, yielding the session.
+
+    Replaces the ~10 lines of identical AsyncMock context-manager wiring
+    each connection test used to build for itself.
+    """
+    session = AsyncMock()
+    session.initialize = AsyncMock()
+    session_cm = AsyncMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    transport_cm = AsyncMock()
+    transport_cm.__aenter__ = AsyncMock(return_value=(AsyncMock(), AsyncMock(), None))
+    transport_cm.__aexit__ = AsyncMock(return_value=False)
+    monkeypatch.setattr(
+        "yourai.knowledge.lex_mcp.streamablehttp_client",
+        MagicMock(return_value=transport_cm),
+    )
+    monkeypatch.setattr(
+        "yourai.knowledge.lex_mcp.ClientSession", MagicMock(return_value=session_cm)
+    )
+    session.session_cm = session_cm
+    session.transport_cm = transport_cm
+    return session
+
+
+class TestConnection:
+    async def test_connect_and_disconnect(self, client, mcp_session):
+        await client.connect()
+        assert client.connected
+        mcp_session.initialize.assert_awaited_once()
+
+        await client.disconnect()
+        assert not client.connected
+        mcp_session.session_cm.__aexit__.assert_awaited_once()
+        mcp_session.transport_cm.__aexit__.assert_awaited_once()
+
+    async def test_context_manager(self, client, mcp_session):
+        async with client as connected_client:
+            assert connected_client.connected
+        assert not client.connected
+
+
+class TestSearch:
+    async def test_calls_tool(self, client, mcp_session):
+        await client.connect()
+        await client.search("data protection", limit=5)
+
+        mcp_session.call_tool.assert_awaited_once_with(
+            "search_legislation", {"query": "data protection", "limit": 5}
+        )
+
+    async def test_search_requires_connection(self, client):
+        with pytest.raises(RuntimeError):
+            await client.search("data protection")
@@ -0,0 +1,70 @@
+"""Tests for hybrid-search RRF fusion."""
+
+import functools
+from uuid import UUID
+
+import pytest
+
+from yourai.knowledge.search import KeywordResult, VectorResult, rrf_fusion
+
+
+@functools.cache
+def _uuid(n: int) -> UUID:
+    return UUID(int=n)
+
+
+def _vec(n: int, score: float) -> VectorResult:
+    return VectorResult(chunk_id=_uuid(n), document_id=_uuid(100 + n), score=score, content=f"c{n}")
+
+
+def _kw(n: int, score: float) -> KeywordResult:
+    return KeywordResult(chunk_id=_uuid(n), document_id=_uuid(100 + n), score=score, content=f"c{n}")
+
+
+def _ids(results) -> list[UUID]:
+    return [result.chunk_id for result in results]
+
+
+# Shared result pool — constructed (and validated) once for all cases.
+V1, V2 = _vec(1, 0.9), _vec(2, 0.8)
+K1, K2, K3 = _kw(1, 12.0), _kw(2, 8.0), _kw(3, 12.0)
+
+# (id, vector, keyword, check) — one row per fusion scenario.
+CASES = [
+    ("empty", [], [], lambda r: r == []),
+    ("vector-only", [V1, V2], [], lambda r: _ids(r) == [_uuid(1), _uuid(2)]),
+    ("keyword-only", [], [K1, K2], lambda r: _ids(r) == [_uuid(1), _uuid(2)]),
+    ("overlap-ranks-first", [V1, V2], [K3, K2], lambda r: _ids(r)[0] == _uuid(2)),
+    ("no-duplicates", [V1, V2], [K2, K1], lambda r: len(r) == 2),
+    (
+        "carries-content",
+        [V1],
+        [],
+        lambda r: r[0].content == "c1" and r[0].document_id == _uuid(101),
+    ),
+    (
+        "ordering-by-score",
+        [_vec(n, 1.0 - n / 10) for n in range(1, 8)],
+        [],
+        lambda r: [result.score for result in r] == sorted((result.score for result in r), reverse=True)
+        and _ids(r) == [_uuid(n) for n in range(1, 8)],
+    ),
+]
+
+
+class TestRRFFusion:
+    @pytest.mark.parametrize(
+        ("vector", "keyword", "check"),
+        [case[1:] for case in CASES],
+        ids=[case[0] for case in CASES],
+    )
+    def test_fusion(self, vector, keyword, check):
+        assert check(rrf_fusion(vector, keyword))
+
+    def test_k_parameter_flattens_rank_gap(self):
+        low_k = rrf_fusion([V1, V2], [], k=1)
+        high_k = rrf_fusion([V1, V2], [], k=1000)
+
+        low_gap = low_k[0].score - low_k[1].score
+        high_gap = high_k[0].score - high_k[1].score
+        assert low_gap > high_gap
@@ -0,0 +1,107 @@
+"""Tests for upload validation and MIME detection."""
+
+import io
+
+import pytest
+
+from yourai.core.exceptions import ValidationError
+from yourai.knowledge import validation
+from yourai.knowledge.validation import detect_mime_type, validate_upload, validate_upload_stream
+
+_DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+class TestDetectMimeType:
+    def test_pdf_magic_bytes(self):
+        assert detect_mime_type(b"%PDF-1.7\n%binary", "upload.bin") == "application/pdf"
+
+    def test_docx_zip_signature(self):
+        assert detect_mime_type(b"PK\x03\x04rest-of-zip", "policy.docx") == _DOCX
+
+    def test_plain_zip_is_not_docx(self):
+        assert detect_mime_type(b"PK\x03\x04rest-of-zip", "archive.zip") == "application/zip"
+
+    def test_html_content(self):
+        assert detect_mime_type(b"  <!DOCTYPE html><html>", "page") == "text/html"
+
+    def test_markdown_extension(self):
+        assert detect_mime_type(b"# Heading\n", "notes.md") == "text/markdown"
+
+    def test_txt_extension(self):
+        assert detect_mime_type(b"hello", "notes.txt") == "text/plain"
+
+    def test_binary_fallback(self):
+        assert detect_mime_type(b"\x00\xff\xfe\x01", "blob") == "application/octet-stream"
+
+    def test_utf8_without_extension_is_text(self):
+        assert detect_mime_type("café".encode(), "readme") == "text/plain"
+
+    def test_accepts_memoryview_prefix(self):
+        data = b"%PDF-1.4" + b"x" * 10_000
+        assert detect_mime_type(memoryview(data)[:32], "doc.pdf") == "application/pdf"
+
+    def test_multibyte_char_split_at_sniff_boundary_is_text(self):
+        data = b"a" * (validation.SNIFF_BYTES - 1) + "é".encode()
+        assert detect_mime_type(data, "readme") == "text/plain"
+
+    def test_deep_detection_used_only_when_enabled(self, monkeypatch):
+        calls: list[bytes] = []
+        monkeypatch.setattr(validation, "_deep_detect", lambda h: calls.append(h) or "image/png")
+
+        assert detect_mime_type(b"\x00\xff\xfe\x01", "blob") == "application/octet-stream"
+        assert calls == []
+
+        monkeypatch.setattr(
+            validation.get_settings(), "enable_deep_mime_detection", True
+        )
+        assert detect_mime_type(b"\x00\xff\xfe\x01", "blob") == "image/png"
+        assert len(calls) == 1
+
+
+class TestValidateUpload:
+    def test_valid_pdf(self):
+        assert validate_upload(b"%PDF-1.7 content", "doc.pdf") == "application/pdf"
+
+    def test_oversized_rejected(self, monkeypatch):
+        monkeypatch.setattr(validation, "MAX_UPLOAD_BYTES", 8)
+
+        with pytest.raises(ValidationError, match="maximum upload size"):
+            validate_upload(b"%PDF-1.7 content", "doc.pdf")
+
+    def test_unsupported_type_rejected(self):
+        with pytest.raises(ValidationError, match="Unsupported file type"):
+            validate_upload(b"PK\x03\x04zipzip", "archive.zip")
+
+    def test_encrypted_pdf_rejected(self):
+        data = b"%PDF-1.7\n" + b"trailer << /Encrypt 5 0 R >>"
+
+        with pytest.raises(ValidationError, match="Encrypted"):
+            validate_upload(data, "doc.pdf")
+
+    def test_encrypted_pdf_rejected_via_trailer(self):
+        data = b"%PDF-1.7\n" + b"x" * 10_000 + b"trailer << /Encrypt 5 0 R >>\n%%EOF"
+
+        with pytest.raises(ValidationError, match="Encrypted"):
+            validate_upload(data, "doc.pdf")
+
+
+class TestValidateUploadStream:
+    def test_valid_pdf(self):
+        reader = io.BytesIO(b"%PDF-1.7\n" + b"x" * 10_000)
+
+        assert validate_upload_stream(reader, "doc.pdf") == "application/pdf"
+        assert reader.tell() == 0
+
+    def test_oversized_rejected_without_reading(self, monkeypatch):
+        monkeypatch.setattr(validation, "MAX_UPLOAD_BYTES", 8)
+        reader = io.BytesIO(b"%PDF-1.7 content")
+        reader.read = None  # type: ignore[assignment]  # size gate must not read
+
+        with pytest.raises(ValidationError, match="maximum upload size"):
+            validate_upload_stream(reader, "doc.pdf")
+
+    def test_encrypted_trailer_rejected(self):
+        data = b"%PDF-1.7\n" + b"x" * 10_000 + b"trailer << /Encrypt 5 0 R >>\n%%EOF"
+
+        with pytest.raises(ValidationError, match="Encrypted"):
+            validate_upload_stream(io.BytesIO(data), "doc.pdf")
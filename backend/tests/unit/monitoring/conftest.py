@@ -0,0 +1,37 @@
+"""Fixtures for monitoring-module tests."""
+
+import httpx
+import orjson
+import pytest
+
+from yourai.monitoring.lex_client import LexRestClient
+
+_JSON_HEADERS = {"content-type": "application/json"}
+_NOT_FOUND: tuple[int, bytes] = (404, orjson.dumps({"detail": "Not found"}))
+
+
+@pytest.fixture(scope="session")
+def lex_routes() -> dict[str, tuple[int, bytes]]:
+    """Mutable routing table the shared mock transport closes over."""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def rest_client(lex_routes) -> LexRestClient:
+    """One LexRestClient over a MockTransport for the whole session.
+
+    Tests never construct clients; they register routes in ``lex_routes``
+    (cleared between tests) as pre-encoded JSON bytes and call methods
+    on this shared instance.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status, body = lex_routes.get(request.url.path, _NOT_FOUND)
+        return httpx.Response(status, content=body, headers=_JSON_HEADERS)
+
+    return LexRestClient("http://lex-test", transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture(autouse=True)
+def _clear_lex_routes(lex_routes):
+    lex_routes.clear()
@@ -0,0 +1,191 @@
+"""Tests for the Lex legislation admin service."""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from yourai.monitoring.legislation_admin import LegislationAdminService
+from yourai.monitoring.lex_client import (
+    Amendment,
+    Legislation,
+    LegislationSection,
+    LexRestClient,
+)
+from yourai.monitoring.lex_health import LexHealthManager
+from yourai.monitoring.lex_tasks import build_ingestion_command
+from yourai.monitoring.models import IngestionJob
+
+
+@pytest.fixture(scope="class")
+def manager() -> LexHealthManager:
+    # Stateless between tests apart from the fallback flag, which the
+    # autouse reset below restores — so one instance per class is safe.
+    return LexHealthManager(
+        LexRestClient("http://lex-primary:8080"),
+        LexRestClient("http://lex-fallback:8080"),
+    )
+
+
+@pytest.fixture(scope="class")
+def service(manager) -> LegislationAdminService:
+    return LegislationAdminService(manager)
+
+
+@pytest.fixture(autouse=True)
+def _reset_fallback(manager):
+    yield
+    manager.force_primary()
+
+
+# Validated once at import instead of once per test run.
+_MOCK_LEGISLATION = Legislation(
+    id="ukpga/2018/12", title="Data Protection Act 2018", type="ukpga", year=2018
+)
+_MOCK_SECTIONS = [
+    LegislationSection(id="s1", number="1", title="Overview"),
+    LegislationSection(id="s2", number="2", title="Terms relating to processing"),
+]
+_MOCK_AMENDMENTS = [
+    Amendment(id="a1", affected_id="ukpga/2018/12", description="Amended by SI 2019/419")
+]
+
+
+class TestGetOverview:
+    async def test_healthy(self, service):
+        with patch.multiple(
+            LexRestClient,
+            health=AsyncMock(return_value=True),
+            count_by_filter=AsyncMock(return_value=4321),
+        ):
+            overview = await service.get_overview()
+
+        assert overview == {
+            "healthy": True,
+            "using_fallback": False,
+            "total_legislation": 4321,
+        }
+
+    async def test_lex_unreachable(self, service):
+        with patch.multiple(
+            LexRestClient,
+            health=AsyncMock(side_effect=httpx.ConnectError("down")),
+            count_by_filter=AsyncMock(side_effect=httpx.ConnectError("down")),
+        ):
+            overview = await service.get_overview()
+
+        assert overview["healthy"] is False
+        assert overview["total_legislation"] == 0
+
+
+class TestSearch:
+    async def test_forwards_params(self, service):
+        search = AsyncMock(return_value=[])
+        with patch.multiple(LexRestClient, search=search):
+            await service.search("data protection", type="ukpga", year=2018, limit=5)
+
+        search.assert_awaited_once_with("data protection", type="ukpga", year=2018, limit=5)
+
+
+class TestGetDetail:
+    async def test_aggregates(self, service):
+        with patch.multiple(
+            LexRestClient,
+            lookup_legislation=AsyncMock(return_value=_MOCK_LEGISLATION),
+            get_legislation_sections=AsyncMock(return_value=_MOCK_SECTIONS),
+            search_amendments=AsyncMock(return_value=_MOCK_AMENDMENTS),
+            aclose=AsyncMock(),
+        ):
+            detail = await service.get_detail("ukpga/2018/12")
+
+        assert detail["legislation"].title == "Data Protection Act 2018"
+        assert [s.number for s in detail["sections"]] == ["1", "2"]
+        assert len(detail["amendments"]) == 1
+
+
+class TestHealthManagement:
+    async def test_check_health(self, manager):
+        with patch.multiple(LexRestClient, health=AsyncMock(return_value=True)):
+            assert await manager.check_health() is True
+        assert manager.using_fallback is False
+
+    async def test_failover_to_fallback(self, manager):
+        with patch.object(
+            LexRestClient,
+            "health",
+            new_callable=AsyncMock,
+            side_effect=[httpx.ConnectError("down"), True],
+        ):
+            assert await manager.check_health() is True
+        assert manager.using_fallback is True
+
+    def test_force_primary(self, manager):
+        manager.force_fallback()
+        assert manager.using_fallback is True
+        manager.force_primary()
+        assert manager.using_fallback is False
+
+
+class TestTargetedIngestionCommand:
+    @pytest.mark.parametrize(
+        ("types", "years", "limit", "expected", "forbidden"),
+        [
+            (
+                ["ukpga", "uksi"],
+                [2018, 2019],
+                100,
+                ["ukpga,uksi", "2018,2019", "--limit", "100"],
+                [],
+            ),
+            (["ukpga"], [2020], None, ["ukpga", "2020"], ["--limit"]),
+        ],
+        ids=["with-limit", "without-limit"],
+    )
+    def test_build_ingestion_command(self, types, years, limit, expected, forbidden):
+        cmd = build_ingestion_command("lex-ingest", types=types, years=years, limit=limit)
+
+        assert cmd[:3] == ["docker", "exec", "lex-ingest"]
+        for token in expected:
+            assert token in cmd
+        for token in forbidden:
+            assert token not in cmd
+
+
+class FakeAsyncSession:
+    """Just enough session surface for trigger_targeted_ingestion.
+
+    A hand-rolled fake is orders of magnitude cheaper than an AsyncMock,
+    which synthesises a child mock tree on every attribute access.
+    """
+
+    def __init__(self) -> None:
+        self.added: list = []
+        self.flush_count = 0
+
+    def add(self, obj) -> None:
+        self.added.append(obj)
+
+    async def flush(self) -> None:
+        self.flush_count += 1
+
+
+class TestTriggerTargetedIngestion:
+    async def test_creates_job_and_dispatches(self, manager):
+        session = FakeAsyncSession()
+        service = LegislationAdminService(manager, session=session)
+        tenant_id = uuid.uuid4()
+        with patch(
+            "yourai.monitoring.legislation_admin.enqueue_ingestion",
+            new_callable=AsyncMock,
+        ) as mock_task:
+            job = await service.trigger_targeted_ingestion(
+                tenant_id, types=["ukpga"], years=[2018], limit=100
+            )
+
+        assert isinstance(job, IngestionJob)
+        assert job.tenant_id == tenant_id
+        assert "--limit" in job.command
+        assert session.added == [job]
+        assert session.flush_count == 1
+        mock_task.assert_awaited_once()
@@ -0,0 +1,105 @@
+"""Tests for the Lex legislation index endpoints (scroll and count)."""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from yourai.monitoring.lex_client import LexRestClient
+
+_BASE = "http://lex-primary:8080"
+
+# One Request prototype per endpoint, built once at import — every
+# httpx.Response below just references the relevant prototype.
+_REQ_SCROLL = httpx.Request("POST", f"{_BASE}/legislation/scroll")
+_REQ_COUNT = httpx.Request("POST", f"{_BASE}/legislation/count")
+
+_ITEM = {"id": "ukpga/2018/12", "title": "Data Protection Act 2018", "type": "ukpga", "year": 2018}
+_ITEM_SI = {"id": "uksi/2019/419", "title": "Amendment Regulations 2019", "type": "uksi", "year": 2019}
+
+
+@pytest.fixture(scope="module")
+def client() -> LexRestClient:
+    return LexRestClient(_BASE)
+
+
+@pytest.fixture(scope="module")
+def _post_mock() -> AsyncMock:
+    # Built once per module; AsyncMock construction is one of the heavier
+    # parts of unittest.mock, so it is not repeated per test.
+    return AsyncMock()
+
+
+@pytest.fixture(autouse=True)
+def async_post(client, _post_mock, monkeypatch) -> AsyncMock:
+    """The client's patched post method, reset between tests."""
+    monkeypatch.setattr(client._client, "post", _post_mock)
+    yield _post_mock
+    _post_mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def make_response():
+    """Factory for index responses, closing over the prebuilt requests."""
+
+    def _make(body: dict, request: httpx.Request = _REQ_SCROLL) -> httpx.Response:
+        return httpx.Response(200, json={"result": body}, request=request)
+
+    return _make
+
+
+class TestScrollLegislation:
+    @pytest.mark.parametrize(
+        ("kwargs", "body", "expected_ids", "expected_next", "expected_payload"),
+        [
+            (
+                {"limit": 2},
+                {"items": [_ITEM, _ITEM_SI], "next_cursor": "abc"},
+                ["ukpga/2018/12", "uksi/2019/419"],
+                "abc",
+                None,
+            ),
+            ({"cursor": "abc"}, {"items": [_ITEM]}, ["ukpga/2018/12"], None, None),
+            (
+                {"limit": 50, "type": "ukpga", "year": 2018},
+                {"items": [], "next_cursor": None},
+                [],
+                None,
+                {"limit": 50, "type": "ukpga", "year": 2018},
+            ),
+        ],
+        ids=["first-page", "last-page", "forwards-filters"],
+    )
+    async def test_scroll(
+        self,
+        client,
+        async_post,
+        make_response,
+        kwargs,
+        body,
+        expected_ids,
+        expected_next,
+        expected_payload,
+    ):
+        async_post.return_value = make_response(body)
+
+        items, next_cursor = await client.scroll_legislation(**kwargs)
+
+        assert [item.id for item in items] == expected_ids
+        assert next_cursor == expected_next
+        if expected_payload is not None:
+            assert async_post.call_args.kwargs["json"] == expected_payload
+
+
+class TestCountByFilter:
+    async def test_count(self, client, async_post, make_response):
+        async_post.return_value = make_response({"count": 7}, request=_REQ_COUNT)
+
+        assert await client.count_by_filter() == 7
+
+    async def test_count_forwards_filters(self, client, async_post, make_response):
+        async_post.return_value = make_response({"count": 3}, request=_REQ_COUNT)
+
+        await client.count_by_filter(type="uksi")
+
+        assert async_post.call_args.kwargs["json"] == {"type": "uksi"}
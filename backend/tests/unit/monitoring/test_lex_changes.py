@@ -0,0 +1,63 @@
+"""Tests for Lex weekly change detection."""
+
+import pytest
+
+from yourai.monitoring.lex_changes import LexChangeDetector, MemorySnapshotStore
+
+_STATS = {"ukpga": 3500, "uksi": 12000}
+_STATS_GROWN = {"ukpga": 3502, "uksi": 12000}
+
+
+class _FakeRest:
+    """The one method the detector touches — no AsyncMock spec walk."""
+
+    def __init__(self, stats: dict[str, int]) -> None:
+        self._stats = stats
+
+    async def get_stats(self) -> dict[str, int]:
+        return self._stats
+
+
+@pytest.fixture
+def store() -> MemorySnapshotStore:
+    return MemorySnapshotStore()
+
+
+def _detector(store, stats) -> LexChangeDetector:
+    return LexChangeDetector(store, _FakeRest(stats))
+
+
+class TestSnapshots:
+    async def test_download_snapshot(self, store):
+        detector = _detector(store, _STATS)
+
+        name = await detector.download_snapshot("baseline")
+
+        assert name == "baseline"
+        assert list(store.iter_names()) == ["baseline"]
+
+    async def test_load_snapshot(self, store):
+        detector = _detector(store, _STATS)
+        await detector.download_snapshot("baseline")
+
+        assert detector.load_snapshot("baseline") == _STATS
+
+
+class TestWeeklyCheck:
+    async def test_first_run_records_baseline(self, store):
+        detector = _detector(store, _STATS)
+
+        result = await detector.weekly_check()
+
+        assert result == {"baseline": True, "changes": {}}
+        assert len(list(store.iter_names())) == 1
+
+    async def test_reports_changes_against_latest_snapshot(self, store):
+        await _detector(store, _STATS).download_snapshot("2026-08-21")
+        detector = _detector(store, _STATS_GROWN)
+
+        result = await detector.weekly_check()
+
+        assert result["baseline"] is False
+        assert result["previous"] == "2026-08-21"
+        assert result["changes"] == {"ukpga": 2}
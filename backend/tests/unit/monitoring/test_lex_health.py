@@ -0,0 +1,80 @@
+"""Tests for Lex primary/fallback health tracking."""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from yourai.monitoring.lex_client import LexRestClient
+from yourai.monitoring.lex_health import LexHealthManager
+
+
+@pytest.fixture(scope="module")
+def manager() -> LexHealthManager:
+    # Constructed once per module; the autouse reset below restores the
+    # only two pieces of state tests mutate.
+    return LexHealthManager(
+        LexRestClient("http://lex-primary:8080"),
+        LexRestClient("http://lex-fallback:8080"),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_manager(manager):
+    manager._using_fallback = False
+    manager._consecutive_failures = 0
+
+
+@pytest.fixture(autouse=True)
+def set_health(monkeypatch):
+    """Stub LexRestClient probing with a single attribute write per test.
+
+    Replaces the previous stacks of nested patch.object context managers,
+    which installed and reversed several descriptors per test.
+    """
+    monkeypatch.setattr(LexRestClient, "aclose", AsyncMock())
+
+    def _set(*, result=None, side_effect=None) -> AsyncMock:
+        mock = AsyncMock(return_value=result, side_effect=side_effect)
+        monkeypatch.setattr(LexRestClient, "health", mock)
+        return mock
+
+    return _set
+
+
+class TestHealthCheck:
+    async def test_primary_healthy(self, manager, set_health):
+        set_health(result=True)
+
+        assert await manager.check_health() is True
+        assert manager.using_fallback is False
+        assert manager.consecutive_failures == 0
+
+    async def test_primary_down_fallback_up(self, manager, set_health):
+        set_health(side_effect=[httpx.ConnectError("down"), True])
+
+        assert await manager.check_health() is True
+        assert manager.using_fallback is True
+        assert manager.consecutive_failures == 1
+
+    async def test_both_down(self, manager, set_health):
+        set_health(side_effect=httpx.ConnectError("down"))
+
+        assert await manager.check_health() is False
+        assert manager.using_fallback is True
+
+    async def test_failures_accumulate(self, manager, set_health):
+        set_health(side_effect=httpx.ConnectError("down"))
+
+        await manager.check_health()
+        await manager.check_health()
+
+        assert manager.consecutive_failures == 2
+
+    async def test_recovery_resets_counter(self, manager, set_health):
+        manager._consecutive_failures = 2
+        set_health(result=True)
+
+        assert await manager.check_health() is True
+        assert manager.consecutive_failures == 0
+        assert manager.using_fallback is False
@@ -0,0 +1,67 @@
+"""Tests for the Lex Qdrant status client."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from yourai.monitoring.lex_qdrant_status import LexQdrantStatusClient
+
+_BASE = "http://qdrant:6333"
+
+
+@pytest.fixture(scope="module")
+def client() -> LexQdrantStatusClient:
+    # One client (and one underlying httpx.AsyncClient) per module; the
+    # tests patch its get method per call and never mutate other state.
+    return LexQdrantStatusClient(_BASE)
+
+
+@pytest.fixture(scope="module")
+def qdrant_responses() -> dict[str, httpx.Response]:
+    """The three stub responses, constructed once per module.
+
+    httpx.Response construction (header dict, URL parsing on the attached
+    request) is not free, so the prototypes are shared across runs.
+    """
+    return {
+        "/collections": httpx.Response(
+            200,
+            json={"result": {"collections": [{"name": "legislation"}, {"name": "caselaw"}]}},
+            request=httpx.Request("GET", f"{_BASE}/collections"),
+        ),
+        "/collections/legislation": httpx.Response(
+            200,
+            json={"result": {"points_count": 1200, "status": "green"}},
+            request=httpx.Request("GET", f"{_BASE}/collections/legislation"),
+        ),
+        "/collections/caselaw": httpx.Response(
+            200,
+            json={"result": {"points_count": 300, "status": "yellow"}},
+            request=httpx.Request("GET", f"{_BASE}/collections/caselaw"),
+        ),
+    }
+
+
+class TestListCollections:
+    async def test_success(self, client, qdrant_responses):
+        def dispatch(url, *args, **kwargs):
+            return qdrant_responses[url]
+
+        with patch.object(client._client, "get", new=AsyncMock(side_effect=dispatch)):
+            collections = await client.list_collections()
+
+        assert collections == [
+            {"name": "legislation", "points": 1200, "status": "green"},
+            {"name": "caselaw", "points": 300, "status": "yellow"},
+        ]
+
+    async def test_error_raises(self, client):
+        error_resp = httpx.Response(
+            500, json={}, request=httpx.Request("GET", f"{_BASE}/collections")
+        )
+        with (
+            patch.object(client._client, "get", new=AsyncMock(return_value=error_resp)),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            await client.list_collections()
@@ -0,0 +1,122 @@
+"""Tests for LexRestClient endpoint methods over the shared mock transport."""
+
+import httpx
+import orjson
+import pytest
+
+SAMPLE_LEGISLATION = {
+    "id": "ukpga/2018/12",
+    "title": "Data Protection Act 2018",
+    "type": "ukpga",
+    "year": 2018,
+}
+SAMPLE_SECTION = {"id": "s1", "number": "1", "title": "Overview"}
+SAMPLE_AMENDMENT = {
+    "id": "a1",
+    "affected_id": "ukpga/2018/12",
+    "description": "Amended by SI 2019/419",
+}
+
+# (id, path, body, method, args, kwargs, check) — one row per endpoint.
+CASES = [
+    (
+        "search",
+        "/legislation/search",
+        {"items": [SAMPLE_LEGISLATION]},
+        "search",
+        ("data protection",),
+        {"type": "ukpga"},
+        lambda r: [item.id for item in r] == ["ukpga/2018/12"],
+    ),
+    (
+        "lookup",
+        "/legislation/lookup",
+        SAMPLE_LEGISLATION,
+        "lookup_legislation",
+        ("ukpga/2018/12",),
+        {},
+        lambda r: r.title == "Data Protection Act 2018" and r.year == 2018,
+    ),
+    (
+        "sections",
+        "/legislation/sections",
+        {"items": [SAMPLE_SECTION]},
+        "get_legislation_sections",
+        ("ukpga/2018/12",),
+        {},
+        lambda r: [s.number for s in r] == ["1"],
+    ),
+    (
+        "amendments",
+        "/amendments/search",
+        {"items": [SAMPLE_AMENDMENT]},
+        "search_amendments",
+        ("ukpga/2018/12",),
+        {},
+        lambda r: r[0].affected_id == "ukpga/2018/12",
+    ),
+    (
+        "scroll",
+        "/legislation/scroll",
+        {"result": {"items": [SAMPLE_LEGISLATION], "next_cursor": "abc"}},
+        "scroll_legislation",
+        (),
+        {"limit": 1},
+        lambda r: len(r[0]) == 1 and r[1] == "abc",
+    ),
+    (
+        "count",
+        "/legislation/count",
+        {"result": {"count": 12}},
+        "count_by_filter",
+        (),
+        {"type": "ukpga"},
+        lambda r: r == 12,
+    ),
+    (
+        "stats",
+        "/stats",
+        {"result": {"ukpga": 3500, "uksi": 12000}},
+        "get_stats",
+        (),
+        {},
+        lambda r: r == {"ukpga": 3500, "uksi": 12000},
+    ),
+    ("health", "/health", {"status": "ok"}, "health", (), {}, lambda r: r is True),
+]
+
+_SERVER_ERROR = orjson.dumps({"detail": "boom"})
+
+
+# Bodies are encoded once at import; the transport serves the bytes as-is.
+@pytest.mark.parametrize(
+    ("path", "body", "method", "args", "kwargs", "check"),
+    [(path, orjson.dumps(body), *rest) for _, path, body, *rest in CASES],
+    ids=[case[0] for case in CASES],
+)
+async def test_endpoint(rest_client, lex_routes, path, body, method, args, kwargs, check):
+    lex_routes[path] = (200, body)
+
+    result = await getattr(rest_client, method)(*args, **kwargs)
+
+    assert check(result)
+
+
+# Error paths need their own transport behaviour, so they stay separate.
+
+
+class TestUtility:
+    async def test_health_unregistered_is_false(self, rest_client):
+        assert await rest_client.health() is False
+
+
+class TestErrors:
+    async def test_lookup_error_raises(self, rest_client, lex_routes):
+        lex_routes["/legislation/lookup"] = (500, _SERVER_ERROR)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await rest_client.lookup_legislation("ukpga/2018/12")
+
+    async def test_unregistered_path_raises(self, rest_client):
+        with pytest.raises(httpx.HTTPStatusError):
+            await rest_client.search("anything")
@@ -0,0 +1,123 @@
+"""Tests for the Lex ingestion background task."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from yourai.monitoring.lex_tasks import _run_ingestion
+from yourai.monitoring.models import IngestionJobStatus
+
+_TENANT_ID = UUID(int=1)
+_JOB_ID = UUID(int=2)
+
+_COMMAND = [
+    "docker",
+    "exec",
+    "lex-ingest",
+    "python",
+    "-m",
+    "lex.ingest",
+    "--mode",
+    "legislation-unified",
+    "--types",
+    "ukpga",
+    "--years",
+    "2018",
+]
+
+_REQUIRED_TOKENS = {"docker", "exec", "--mode", "legislation-unified"}
+
+
+class _AsyncLineIter:
+    """Async iterator over canned stdout lines."""
+
+    def __init__(self, lines):
+        self._lines = iter(lines)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._lines)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+def make_proc(lines: tuple[bytes, ...] = (), rc: int = 0) -> MagicMock:
+    """A fake subprocess with canned stdout lines and exit code."""
+    proc = MagicMock()
+    proc.stdout = _AsyncLineIter(list(lines))
+    proc.wait = AsyncMock(return_value=rc)
+    return proc
+
+
+def fresh_session(job) -> AsyncMock:
+    """A preconfigured async-session mock whose queries return ``job``."""
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalar_one.return_value = job
+    result.scalar_one_or_none.return_value = job
+    session.execute.return_value = result
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return session
+
+
+@pytest.fixture
+def ingestion_env(monkeypatch) -> SimpleNamespace:
+    """One bundle of job/session/subprocess stubs shared by every test.
+
+    Tests tweak ``lines`` and ``returncode`` before calling the task and
+    read the dispatched command back from ``captured``.
+    """
+    job = SimpleNamespace(
+        tenant_id=_TENANT_ID,
+        command=list(_COMMAND),
+        status=IngestionJobStatus.QUEUED,
+        started_at=None,
+        completed_at=None,
+        error_message=None,
+    )
+    env = SimpleNamespace(
+        job=job, session=fresh_session(job), captured={}, lines=[], returncode=0
+    )
+
+    async def fake_subprocess(*args, **kwargs):
+        env.captured["cmd"] = list(args)
+        return make_proc(tuple(env.lines), env.returncode)
+
+    monkeypatch.setattr(
+        "yourai.monitoring.lex_tasks.asyncio.create_subprocess_exec", fake_subprocess
+    )
+    return env
+
+
+class TestRunIngestion:
+    async def test_builds_correct_command(self, ingestion_env):
+        ingestion_env.lines = [b"ingesting ukpga...\n"]
+
+        await _run_ingestion(_JOB_ID, _TENANT_ID, lambda: ingestion_env.session)
+
+        missing = _REQUIRED_TOKENS - set(ingestion_env.captured["cmd"])
+        assert not missing, f"missing tokens: {missing}"
+
+    async def test_job_status_transitions(self, ingestion_env):
+        await _run_ingestion(_JOB_ID, _TENANT_ID, lambda: ingestion_env.session)
+
+        job = ingestion_env.job
+        assert job.status == IngestionJobStatus.SUCCEEDED
+        assert job.started_at is not None
+        assert job.completed_at is not None
+        assert ingestion_env.session.commit.await_count == 2
+
+    async def test_failure_sets_error(self, ingestion_env):
+        ingestion_env.lines = [b"boom\n"]
+        ingestion_env.returncode = 1
+
+        await _run_ingestion(_JOB_ID, _TENANT_ID, lambda: ingestion_env.session)
+
+        assert ingestion_env.job.status == IngestionJobStatus.FAILED
+        assert "1" in ingestion_env.job.error_message
@@ -0,0 +1,177 @@
+"""Fixtures for policy-module tests."""
+
+import functools
+import uuid
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from yourai.core.database import uuid7
+from yourai.core.models import Tenant
+from yourai.policy.ontology import OntologyService
+from yourai.policy.review import PolicyReviewEngine
+
+
+@functools.lru_cache
+def _anthropic_response(text: str, input_tokens: int, output_tokens: int) -> SimpleNamespace:
+    """Memoised response graph — most tests reuse the same canned payload.
+
+    Plain attribute bags: the response is only ever read, so it needs
+    none of ``Mock``'s per-instance bookkeeping.
+    """
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens),
+    )
+
+
+@pytest.fixture
+def mock_anthropic_factory():
+    """Builds an Anthropic client mock whose ``messages.create`` returns ``text``."""
+
+    def factory(text: str, input_tokens: int = 100, output_tokens: int = 50) -> AsyncMock:
+        client = AsyncMock()
+        client.messages.create.return_value = _anthropic_response(
+            text, input_tokens, output_tokens
+        )
+        return client
+
+    return factory
+
+
+@pytest.fixture
+def anthropic_response():
+    """Builds (and memoises) a canned ``messages.create`` response."""
+
+    def build(text: str, input_tokens: int = 100, output_tokens: int = 50) -> SimpleNamespace:
+        return _anthropic_response(text, input_tokens, output_tokens)
+
+    return build
+
+
+@pytest.fixture
+def mock_anthropic() -> AsyncMock:
+    """A bare Anthropic client mock; tests assign the response payload."""
+    return AsyncMock()
+
+
+class FakeRedisPipeline:
+    """Hand-written pipeline fake: fluent commands, awaitable ``execute``.
+
+    Cheaper than an ``AsyncMock`` attribute graph, and ``execute_calls``
+    gives tests the only bookkeeping they need.
+    """
+
+    def __init__(self, result: list[Any]) -> None:
+        self._result = result
+        self.execute_calls = 0
+
+    def zadd(self, *args: Any, **kwargs: Any) -> "FakeRedisPipeline":
+        return self
+
+    def zremrangebyscore(self, *args: Any, **kwargs: Any) -> "FakeRedisPipeline":
+        return self
+
+    def expire(self, *args: Any, **kwargs: Any) -> "FakeRedisPipeline":
+        return self
+
+    def publish(self, *args: Any, **kwargs: Any) -> "FakeRedisPipeline":
+        return self
+
+    async def execute(self) -> list[Any]:
+        self.execute_calls += 1
+        return self._result
+
+
+class FakeRedis:
+    """A Redis fake that hands back one shared :class:`FakeRedisPipeline`."""
+
+    def __init__(self, result: list[Any] | None = None) -> None:
+        self.pipe = FakeRedisPipeline([1, 0, True, 1] if result is None else result)
+
+    def pipeline(self) -> FakeRedisPipeline:
+        return self.pipe
+
+
+@pytest.fixture
+def mock_redis_pipeline(mock_redis: FakeRedis) -> FakeRedisPipeline:
+    """The pipeline ``mock_redis`` hands out, for call-count assertions."""
+    return mock_redis.pipe
+
+
+@pytest.fixture
+def mock_lex() -> AsyncMock:
+    """A Lex client mock with section search pre-stubbed to no results."""
+    lex: Any = AsyncMock()
+    lex.search_legislation_sections.return_value = []
+    return lex
+
+
+@pytest.fixture
+def mock_redis() -> FakeRedis:
+    """A fresh :class:`FakeRedis` per test."""
+    return FakeRedis()
+
+
+class _FakeSearch:
+    """A search service whose retrieval legs find nothing."""
+
+    async def hybrid_search(self, tenant_id: uuid.UUID, query: str, *, limit: int = 10):
+        return []
+
+
+@pytest.fixture
+def fake_search_service() -> _FakeSearch:
+    return _FakeSearch()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def review_engine(
+    test_session, mock_redis, mock_anthropic, mock_lex, fake_search_service
+):
+    """An engine over the rollback-per-test session and the fake trio.
+
+    The search service is injected rather than patched — the state
+    machine under test does not care what the retrieval legs return.
+    """
+    return PolicyReviewEngine(
+        test_session, mock_redis, mock_anthropic, mock_lex, search_service=fake_search_service
+    )
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def ontology_svc(test_session) -> OntologyService:
+    """The service under test, constructed once per test session fixture."""
+    return OntologyService(test_session)
+
+
+@pytest.fixture(scope="module")
+def uuid_pool() -> Iterator[uuid.UUID]:
+    """UUIDs generated once per module; tests draw via ``new_uuid``."""
+    return iter([uuid7() for _ in range(64)])
+
+
+@pytest.fixture
+def new_uuid(uuid_pool: Iterator[uuid.UUID]) -> uuid.UUID:
+    """A fresh UUID from the module pool."""
+    return next(uuid_pool)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def other_tenant(db_engine) -> Tenant:
+    """A second tenant for isolation tests, committed once per module.
+
+    The slug carries a unique suffix because ``--dist loadscope``
+    schedules per class, so the module fixture can be re-instantiated on
+    a worker whose database already holds the earlier row.
+    """
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        tenant = Tenant(name="Policy Other", slug=f"policy-other-{uuid7().hex[-8:]}")
+        session.add(tenant)
+        await session.commit()
+    return tenant
@@ -0,0 +1,238 @@
+"""Tests for the policy ontology service."""
+
+import pytest
+
+from yourai.core.exceptions import ConflictError, NotFoundError
+from yourai.policy.schemas import CreateDefinition
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+class TestGroups:
+    async def test_create_group(self, ontology_svc, sample_tenant):
+        group = await ontology_svc.create_group(
+            sample_tenant.id, uri="grp:aml", name="Anti-Money Laundering"
+        )
+
+        assert group.id is not None
+        assert group.tenant_id == sample_tenant.id
+
+    async def test_get_group(self, ontology_svc, sample_tenant):
+        created = await ontology_svc.create_group(
+            sample_tenant.id, uri="grp:gdpr", name="Data Protection"
+        )
+
+        fetched = await ontology_svc.get_group(sample_tenant.id, created.id)
+
+        assert fetched.uri == "grp:gdpr"
+
+    async def test_get_group_not_found(self, ontology_svc, sample_tenant, new_uuid):
+        with pytest.raises(NotFoundError):
+            await ontology_svc.get_group(sample_tenant.id, new_uuid)
+
+    async def test_list_groups(self, ontology_svc, sample_tenant):
+        created = await ontology_svc.bulk_create_groups(
+            sample_tenant.id, [("grp:b", "Beta"), ("grp:a", "Alpha")]
+        )
+        assert [group.uri for group in created] == ["grp:b", "grp:a"]
+
+        groups = await ontology_svc.list_groups(sample_tenant.id)
+
+        assert [group.name for group in groups] == ["Alpha", "Beta"]
+
+    async def test_delete_group(self, ontology_svc, sample_tenant):
+        group = await ontology_svc.create_group(sample_tenant.id, uri="grp:tmp", name="Temp")
+
+        await ontology_svc.delete_group(sample_tenant.id, group.id)
+
+        with pytest.raises(NotFoundError):
+            await ontology_svc.get_group(sample_tenant.id, group.id)
+
+    async def test_groups_tenant_isolation(self, ontology_svc, sample_tenant, other_tenant):
+        group = await ontology_svc.create_group(
+            other_tenant.id, uri="grp:other", name="Other Tenant Group"
+        )
+
+        with pytest.raises(NotFoundError):
+            await ontology_svc.get_group(sample_tenant.id, group.id)
+        assert await ontology_svc.list_groups(sample_tenant.id) == []
+
+
+class TestTopics:
+    async def test_create_topic(self, ontology_svc, sample_tenant):
+        topic = await ontology_svc.create_topic(
+            sample_tenant.id, uri="top:kyc", name="Know Your Customer"
+        )
+
+        assert topic.tenant_id == sample_tenant.id
+
+    async def test_list_topics(self, ontology_svc, sample_tenant):
+        await ontology_svc.bulk_create_topics(
+            sample_tenant.id, [("top:b", "Retention"), ("top:a", "Consent")]
+        )
+
+        topics = await ontology_svc.list_topics(sample_tenant.id)
+
+        assert [topic.name for topic in topics] == ["Consent", "Retention"]
+
+    async def test_delete_topic(self, ontology_svc, sample_tenant):
+        topic = await ontology_svc.create_topic(sample_tenant.id, uri="top:tmp", name="Temp")
+
+        await ontology_svc.delete_topic(sample_tenant.id, topic.id)
+
+        with pytest.raises(NotFoundError):
+            await ontology_svc.get_topic(sample_tenant.id, topic.id)
+
+
+class TestDefinitions:
+    async def test_create_definition(self, ontology_svc, sample_tenant):
+        definition = await ontology_svc.create_definition(
+            sample_tenant.id,
+            CreateDefinition(uri="def:retention", name="Record Retention"),
+        )
+
+        assert definition.id is not None
+        assert definition.uri == "def:retention"
+
+    async def test_create_definition_with_group_and_topics(self, ontology_svc, sample_tenant):
+        group = await ontology_svc.create_group(sample_tenant.id, uri="grp:dp", name="DP")
+        topic = await ontology_svc.create_topic(sample_tenant.id, uri="top:c", name="Consent")
+
+        definition = await ontology_svc.create_definition(
+            sample_tenant.id,
+            CreateDefinition(
+                uri="def:consent",
+                name="Consent Records",
+                group_id=group.id,
+                topic_ids=[topic.id],
+            ),
+        )
+
+        assert definition.group_id == group.id
+        assert [t.uri for t in definition.topics] == ["top:c"]
+
+    async def test_create_definition_with_compliance_and_scoring_criteria(
+        self, ontology_svc, sample_tenant
+    ):
+        definition = await ontology_svc.create_definition(
+            sample_tenant.id,
+            CreateDefinition(
+                uri="def:dpia",
+                name="DPIA Required",
+                compliance_criteria=["Names a responsible officer"],
+                scoring_criteria=["Clarity of escalation path"],
+                legislation_references=["ukpga/2018/12"],
+            ),
+        )
+
+        assert [c.text for c in definition.compliance_criteria] == [
+            "Names a responsible officer"
+        ]
+        assert [s.text for s in definition.scoring_criteria] == ["Clarity of escalation path"]
+        assert [r.legislation_id for r in definition.legislation_references] == [
+            "ukpga/2018/12"
+        ]
+
+    async def test_create_definition_duplicate_uri_raises_conflict(
+        self, ontology_svc, sample_tenant
+    ):
+        await ontology_svc.create_definition(
+            sample_tenant.id, CreateDefinition(uri="def:dup", name="First")
+        )
+
+        with pytest.raises(ConflictError):
+            await ontology_svc.create_definition(
+                sample_tenant.id, CreateDefinition(uri="def:dup", name="Second")
+            )
+
+    async def test_get_definition_eager_loads_children(
+        self, ontology_svc, sample_tenant, test_session
+    ):
+        created = await ontology_svc.create_definition(
+            sample_tenant.id,
+            CreateDefinition(
+                uri="def:eager",
+                name="Eager",
+                compliance_criteria=["Has an owner"],
+                legislation_references=["ukpga/2018/12"],
+            ),
+        )
+        definition_id = created.id
+        # Drop loaded state so the fetch must bring the children itself;
+        # a lazy load here would raise under asyncio.
+        test_session.expire_all()
+
+        fetched = await ontology_svc.get_definition(sample_tenant.id, definition_id)
+
+        assert [c.text for c in fetched.compliance_criteria] == ["Has an owner"]
+        assert [r.legislation_id for r in fetched.legislation_references] == ["ukpga/2018/12"]
+
+    async def test_get_definition_not_found(self, ontology_svc, sample_tenant, new_uuid):
+        with pytest.raises(NotFoundError):
+            await ontology_svc.get_definition(sample_tenant.id, new_uuid)
+
+    async def test_list_definitions(self, ontology_svc, sample_tenant):
+        await ontology_svc.create_definition(
+            sample_tenant.id, CreateDefinition(uri="def:b", name="Beta")
+        )
+        await ontology_svc.create_definition(
+            sample_tenant.id, CreateDefinition(uri="def:a", name="Alpha")
+        )
+
+        definitions = await ontology_svc.list_definitions(sample_tenant.id)
+
+        assert [definition.name for definition in definitions] == ["Alpha", "Beta"]
+
+    async def test_list_definitions_filter_by_group(self, ontology_svc, sample_tenant):
+        group = await ontology_svc.create_group(sample_tenant.id, uri="grp:f", name="Filtered")
+        await ontology_svc.create_definition(
+            sample_tenant.id, CreateDefinition(uri="def:in", name="In Group", group_id=group.id)
+        )
+        await ontology_svc.create_definition(
+            sample_tenant.id, CreateDefinition(uri="def:out", name="Outside")
+        )
+
+        definitions = await ontology_svc.list_definitions(sample_tenant.id, group_id=group.id)
+
+        assert [definition.uri for definition in definitions] == ["def:in"]
+
+    async def test_delete_definition(self, ontology_svc, sample_tenant):
+        definition = await ontology_svc.create_definition(
+            sample_tenant.id, CreateDefinition(uri="def:tmp", name="Temp")
+        )
+
+        await ontology_svc.delete_definition(sample_tenant.id, definition.id)
+
+        with pytest.raises(NotFoundError):
+            await ontology_svc.get_definition(sample_tenant.id, definition.id)
+
+    async def test_definitions_tenant_isolation(self, ontology_svc, sample_tenant, other_tenant):
+        definition = await ontology_svc.create_definition(
+            other_tenant.id, CreateDefinition(uri="def:other", name="Other Tenant")
+        )
+
+        with pytest.raises(NotFoundError):
+            await ontology_svc.get_definition(sample_tenant.id, definition.id)
+        # The same URI is free for a different tenant.
+        await ontology_svc.create_definition(
+            sample_tenant.id, CreateDefinition(uri="def:other", name="Ours")
+        )
+
+
+class TestSeedDefinitions:
+    async def test_seed_definitions_skips_duplicates(self, ontology_svc, sample_tenant):
+        await ontology_svc.create_definition(
+            sample_tenant.id, CreateDefinition(uri="def:seeded", name="Existing")
+        )
+
+        created = await ontology_svc.seed_definitions(
+            sample_tenant.id,
+            [
+                CreateDefinition(uri="def:seeded", name="Duplicate"),
+                CreateDefinition(uri="def:new-1", name="New One"),
+                CreateDefinition(uri="def:new-2", name="New Two"),
+            ],
+        )
+
+        assert sorted(definition.uri for definition in created) == ["def:new-1", "def:new-2"]
+        assert len(await ontology_svc.list_definitions(sample_tenant.id)) == 3
@@ -0,0 +1,132 @@
+"""Tests for the policy review engine's state machine."""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from yourai.core.database import uuid7
+from yourai.core.exceptions import NotFoundError
+from yourai.policy.models import PolicyDefinition
+from yourai.policy.review import PolicyReview, PolicyReviewState
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+_DOCUMENT = "All staff must complete annual data-protection training."
+
+# Canonical model responses, serialised once at import.
+_GREEN_REVIEW_JSON = '{"rating": "green", "justification": "Fully compliant."}'
+_AMBER_REVIEW_JSON = '{"rating": "amber", "justification": "Partial coverage."}'
+_COMPLIANT_REVIEW_JSON = '{"rating": "green", "justification": "Compliant."}'
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def simple_policy_definition(test_session, sample_tenant) -> PolicyDefinition:
+    """One definition shared by every test in this module."""
+    definition = PolicyDefinition(
+        tenant_id=sample_tenant.id, uri="policy:review-target", name="Review Target"
+    )
+    test_session.add(definition)
+    await test_session.flush()
+    return definition
+
+
+class TestStartReview:
+    @pytest.mark.parametrize(
+        ("payload", "rating", "justification", "input_tokens", "output_tokens"),
+        [
+            (_GREEN_REVIEW_JSON, "green", "Fully compliant.", 100, 50),
+            (_AMBER_REVIEW_JSON, "amber", "Partial coverage.", 100, 50),
+            (_COMPLIANT_REVIEW_JSON, "green", "Compliant.", 321, 123),
+        ],
+        ids=["green", "amber", "token-usage"],
+    )
+    async def test_review_completes(
+        self,
+        test_session,
+        sample_tenant,
+        review_engine,
+        mock_anthropic,
+        anthropic_response,
+        mock_redis_pipeline,
+        simple_policy_definition,
+        payload,
+        rating,
+        justification,
+        input_tokens,
+        output_tokens,
+    ):
+        mock_anthropic.messages.create.return_value = anthropic_response(
+            payload, input_tokens=input_tokens, output_tokens=output_tokens
+        )
+
+        review = await review_engine.start_review(
+            sample_tenant.id, simple_policy_definition.id, _DOCUMENT
+        )
+
+        assert review.state is PolicyReviewState.COMPLETE
+        assert review.rating == rating
+        assert review.justification == justification
+        assert review.input_tokens == input_tokens
+        assert review.output_tokens == output_tokens
+        assert mock_redis_pipeline.execute_calls == 2
+
+    async def test_review_errors_on_unknown_definition(
+        self, test_session, sample_tenant, review_engine
+    ):
+        with pytest.raises(NotFoundError):
+            await review_engine.start_review(sample_tenant.id, uuid7(), _DOCUMENT)
+
+        reviews = (
+            await test_session.scalars(
+                select(PolicyReview).where(PolicyReview.tenant_id == sample_tenant.id)
+            )
+        ).all()
+        assert [review.state for review in reviews] == [PolicyReviewState.ERROR]
+
+
+# Allowed cancel transitions: (initial state, expected state after cancel).
+# Terminal states are no-ops and must not publish a progress event.
+_CANCEL_TRANSITIONS = [
+    (PolicyReviewState.PENDING, PolicyReviewState.CANCELLED),
+    (PolicyReviewState.PROCESSING, PolicyReviewState.CANCELLED),
+    (PolicyReviewState.COMPLETE, PolicyReviewState.COMPLETE),
+    (PolicyReviewState.CANCELLED, PolicyReviewState.CANCELLED),
+    (PolicyReviewState.ERROR, PolicyReviewState.ERROR),
+]
+
+
+class TestCancelReview:
+    @pytest.mark.parametrize(
+        "transition",
+        _CANCEL_TRANSITIONS,
+        ids=lambda t: f"{t[0].value}->{t[1].value}",
+    )
+    async def test_cancel_transitions(
+        self,
+        test_session,
+        sample_tenant,
+        review_engine,
+        mock_redis_pipeline,
+        simple_policy_definition,
+        transition,
+    ):
+        initial, expected = transition
+        review = PolicyReview(
+            tenant_id=sample_tenant.id,
+            definition_id=simple_policy_definition.id,
+            state=initial,
+        )
+        test_session.add(review)
+        await test_session.flush()
+
+        result = await review_engine.cancel_review(sample_tenant.id, review.id)
+
+        # Identity-map hit — the engine wrote through this same session.
+        fresh = await test_session.get(PolicyReview, review.id)
+        assert result.state is expected
+        assert fresh.state is expected
+        assert mock_redis_pipeline.execute_calls == (1 if expected is not initial else 0)
+
+    async def test_cancel_unknown_review_raises(self, sample_tenant, review_engine):
+        with pytest.raises(NotFoundError):
+            await review_engine.cancel_review(sample_tenant.id, uuid7())
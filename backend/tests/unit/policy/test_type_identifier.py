@@ -0,0 +1,207 @@
+"""Tests for classifying documents against the policy ontology."""
+
+import pytest
+import pytest_asyncio
+
+from yourai.core.models import Tenant
+from yourai.policy.models import PolicyDefinition
+from yourai.policy.type_identifier import (
+    MAX_DOCUMENT_CHARS,
+    TRUNCATION_MARKER,
+    PolicyTypeIdentifier,
+)
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+_DOCUMENT = "This policy sets out how personal data is collected and stored."
+
+# Canonical classifier responses, serialised once at import.
+_MATCH_DATA_PROTECTION_JSON = '{"definition_uri": "policy:data-protection"}'
+_MATCH_INACTIVE_JSON = '{"definition_uri": "policy:inactive"}'
+_MATCH_THEIRS_JSON = '{"definition_uri": "policy:theirs"}'
+_NO_MATCH_JSON = '{"definition_uri": null}'
+
+
+class _FakeAnthropic:
+    """Hand-written client fake for the happy path.
+
+    Records the last ``messages.create`` kwargs and returns whatever
+    ``response`` is assigned — no Mock machinery at all.
+    """
+
+    class _Messages:
+        def __init__(self, outer: "_FakeAnthropic") -> None:
+            self._outer = outer
+
+        async def create(self, **kwargs):
+            self._outer.last_kwargs = kwargs
+            self._outer.calls += 1
+            return self._outer.response
+
+    def __init__(self) -> None:
+        self.response = None
+        self.last_kwargs: dict | None = None
+        self.calls = 0
+        self.messages = self._Messages(self)
+
+    def prompt(self) -> str:
+        assert self.last_kwargs is not None
+        return self.last_kwargs["messages"][0]["content"]
+
+
+@pytest.fixture
+def fake_anthropic() -> _FakeAnthropic:
+    return _FakeAnthropic()
+
+
+@pytest.fixture
+def identifier(fake_anthropic) -> PolicyTypeIdentifier:
+    """The identifier under test, built once per test over the fake client."""
+    return PolicyTypeIdentifier(fake_anthropic)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def sample_policy_definitions(test_session, sample_tenant) -> list[PolicyDefinition]:
+    """Two active definitions for the shared tenant."""
+    definitions = [
+        PolicyDefinition(
+            tenant_id=sample_tenant.id,
+            uri="policy:data-protection",
+            name="Data Protection",
+            description="Handling of personal data.",
+        ),
+        PolicyDefinition(
+            tenant_id=sample_tenant.id,
+            uri="policy:health-safety",
+            name="Health and Safety",
+            description="Workplace safety obligations.",
+        ),
+    ]
+    test_session.add_all(definitions)
+    await test_session.flush()
+    return definitions
+
+
+class TestIdentifyPolicyType:
+    async def test_returns_matching_definition(
+        self,
+        test_session,
+        sample_tenant,
+        sample_policy_definitions,
+        identifier,
+        fake_anthropic,
+        anthropic_response,
+    ):
+        fake_anthropic.response = anthropic_response(_MATCH_DATA_PROTECTION_JSON)
+        match = await identifier.identify_policy_type(
+            test_session, sample_tenant.id, _DOCUMENT
+        )
+        assert match is sample_policy_definitions[0]
+
+    async def test_returns_none_for_no_match(
+        self,
+        test_session,
+        sample_tenant,
+        sample_policy_definitions,
+        identifier,
+        fake_anthropic,
+        anthropic_response,
+    ):
+        fake_anthropic.response = anthropic_response(_NO_MATCH_JSON)
+        match = await identifier.identify_policy_type(
+            test_session, sample_tenant.id, _DOCUMENT
+        )
+        assert match is None
+
+    async def test_filters_inactive_definitions(
+        self, test_session, sample_tenant, identifier, fake_anthropic, anthropic_response
+    ):
+        active = PolicyDefinition(
+            tenant_id=sample_tenant.id, uri="policy:active", name="Active"
+        )
+        inactive = PolicyDefinition(
+            tenant_id=sample_tenant.id,
+            uri="policy:inactive",
+            name="Inactive",
+            active=False,
+        )
+        test_session.add_all([active, inactive])
+        await test_session.flush()
+        fake_anthropic.response = anthropic_response(_MATCH_INACTIVE_JSON)
+        match = await identifier.identify_policy_type(
+            test_session, sample_tenant.id, _DOCUMENT
+        )
+        assert match is None
+        prompt = fake_anthropic.prompt()
+        assert "policy:inactive" not in prompt
+
+    async def test_tenant_isolation(
+        self,
+        test_session,
+        sample_policy_definitions,
+        identifier,
+        fake_anthropic,
+        anthropic_response,
+        new_uuid,
+    ):
+        # Explicit id lets the tenant and its definition flush in one batch.
+        other_tenant = Tenant(
+            id=new_uuid, name="Identifier Other", slug=f"ident-other-{new_uuid.hex[-8:]}"
+        )
+        other_definition = PolicyDefinition(
+            tenant_id=other_tenant.id, uri="policy:theirs", name="Theirs"
+        )
+        test_session.add_all([other_tenant, other_definition])
+        await test_session.flush()
+        fake_anthropic.response = anthropic_response(_MATCH_THEIRS_JSON)
+        match = await identifier.identify_policy_type(
+            test_session, other_tenant.id, _DOCUMENT
+        )
+        assert match is other_definition
+        prompt = fake_anthropic.prompt()
+        assert "policy:data-protection" not in prompt
+
+    async def test_prompt_includes_definition_metadata(
+        self,
+        test_session,
+        sample_tenant,
+        sample_policy_definitions,
+        identifier,
+        fake_anthropic,
+        anthropic_response,
+    ):
+        fake_anthropic.response = anthropic_response(_NO_MATCH_JSON)
+        await identifier.identify_policy_type(test_session, sample_tenant.id, _DOCUMENT)
+        prompt = fake_anthropic.prompt()
+        assert "policy:data-protection: Data Protection — Handling of personal data." in prompt
+        assert "policy:health-safety: Health and Safety — Workplace safety obligations." in prompt
+
+    async def test_truncates_long_documents(
+        self,
+        test_session,
+        sample_tenant,
+        sample_policy_definitions,
+        identifier,
+        fake_anthropic,
+        anthropic_response,
+    ):
+        # Just past the limit is enough to prove the truncation invariant.
+        long_document = "A" * (MAX_DOCUMENT_CHARS + 100)
+        fake_anthropic.response = anthropic_response(_NO_MATCH_JSON)
+        await identifier.identify_policy_type(
+            test_session, sample_tenant.id, long_document
+        )
+        prompt = fake_anthropic.prompt()
+        assert prompt.endswith(TRUNCATION_MARKER)
+        assert "A" * MAX_DOCUMENT_CHARS in prompt
+        assert "A" * (MAX_DOCUMENT_CHARS + 1) not in prompt
+
+    async def test_returns_none_with_no_definitions(
+        self, test_session, sample_tenant, identifier, fake_anthropic, anthropic_response
+    ):
+        fake_anthropic.response = anthropic_response(_NO_MATCH_JSON)
+        match = await identifier.identify_policy_type(
+            test_session, sample_tenant.id, _DOCUMENT
+        )
+        assert match is None
+        assert fake_anthropic.calls == 0